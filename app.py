@@ -1,17 +1,27 @@
 import argparse
 import datetime as dt
+import functools
+import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .csv_store import (
     add_vacation,
+    append_missions,
+    build_vacation_index,
     get_missions_for_date,
-    get_person_by_id,
     get_person_by_name,
     get_vacations_for_date,
-    is_on_vacation,
+    index_missions,
+    index_missions_by_date,
+    index_people,
     load_campaign,
     load_missions,
+    load_mission_ids,
     load_mission_templates,
     load_people,
     load_preferences,
@@ -24,7 +34,49 @@ from .csv_store import (
     add_preference,
 )
 from .data_models import Campaign, Mission, MissionTemplate, Person, Preference
-from .scheduler import Scheduler, suggest_vacations
+from .scheduler import CandidateScore, Scheduler, suggest_vacations
+
+
+# Valid values for interactive inputs; frozensets give O(1) membership tests
+_STATUSES = frozenset({"planned", "started", "completed"})
+_ACTIVE_STATUSES = frozenset({"started", "completed"})
+_ASSIGNABLE_STATUSES = frozenset({"planned", "tentative", "must"})
+_PRIORITIES = frozenset({"low", "medium", "high"})
+_VALID_PREF_TYPES = frozenset({
+    "rest_multiplier", "pair_with", "avoid_person", "prefer_mission",
+    "avoid_mission", "prefer_weekend", "prefer_weekday",
+    "prefer_vacation_date", "must_vacation_date",
+})
+_TARGETED_PREF_TYPES = frozenset({
+    "rest_multiplier", "pair_with", "avoid_person", "prefer_mission",
+    "avoid_mission", "prefer_vacation_date", "must_vacation_date",
+})
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Effective-role buckets (medics count as soldiers, cmd+off+samal as command)
+# Primary role -> effective role for headcount purposes; roles not listed
+# here count as themselves
+_EFFECTIVE_ROLE = {
+    'medic': 'soldier',
+    'soldier': 'soldier',
+    'commander': 'command',
+    'officer': 'command',
+    'samal': 'command',
+}
+
+
+def _index_people(people: List[Person]) -> Tuple[Dict[str, Person], Dict[str, Person]]:
+    """Build id->person and lowercased-name->person lookup dicts."""
+    by_id = index_people(people)
+    by_name = {p.name.lower(): p for p in people}
+    return by_id, by_name
+
+
+def _find_person(people: List[Person], query: str) -> Optional[Person]:
+    """Resolve a person by ID or name via dict probes, falling back to partial match."""
+    by_id, by_name = _index_people(people)
+    return by_id.get(query) or by_name.get(query.lower()) or get_person_by_name(people, query)
 
 
 def load_missions_with_templates(data_dir: Path):
@@ -34,6 +86,21 @@ def load_missions_with_templates(data_dir: Path):
     return missions, templates
 
 
+def _load_all(data_dir: Path):
+    """
+    Load people, missions (with templates), and vacations concurrently.
+
+    The three loaders are independent and I/O-bound; overlapping the file
+    reads in a small thread pool shaves command startup on a cold cache.
+    Returns (people, (missions, templates), vacations).
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        people_f = pool.submit(load_people, data_dir / "people.csv")
+        missions_f = pool.submit(load_missions_with_templates, data_dir)
+        vacations_f = pool.submit(load_vacations, data_dir / "vacations.csv")
+        return people_f.result(), missions_f.result(), vacations_f.result()
+
+
 def init_campaign(data_dir: Path, name: str) -> None:
     """Initialize campaign directory and create missing files."""
     data_dir.mkdir(parents=True, exist_ok=True)
@@ -79,9 +146,9 @@ def init_campaign(data_dir: Path, name: str) -> None:
     if is_new:
         print("Campaign created! Next steps:")
         print("  1. Add people to people.csv")
-        print("  2. Add missions: --add-mission")
-        print("  3. Plan vacations: --plan-vacations --date=YYYY-MM-DD")
-        print("  4. Assign people: --assign --date=YYYY-MM-DD")
+        print("  2. Add missions: add-mission")
+        print("  3. Plan vacations: plan-vacations --date=YYYY-MM-DD")
+        print("  4. Assign people: assign --date=YYYY-MM-DD")
     else:
         print("Use --help to see available commands.")
 
@@ -158,8 +225,8 @@ def add_mission_interactive(data_dir: Path) -> None:
         return
     
     campaign = load_campaign(campaign_path)
-    existing_missions = load_missions(missions_path)
-    existing_ids = {m.mission_id for m in existing_missions}
+    # Only IDs are needed for duplicate detection; skip the full mission load
+    existing_ids = load_mission_ids(missions_path)
     
     print("Adding a new mission to the campaign.")
     print()
@@ -303,9 +370,9 @@ def add_mission_interactive(data_dir: Path) -> None:
         )
         new_missions.append(mission)
     
-    existing_missions.extend(new_missions)
-    save_missions(missions_path, existing_missions)
-    
+    # Append only the new rows instead of rewriting the full file
+    append_missions(missions_path, new_missions)
+
     print()
     if is_repeated:
         print(f"Repeated mission '{name}' added successfully!")
@@ -323,12 +390,8 @@ def edit_mission_interactive(data_dir: Path, mission_id: str) -> None:
     missions_path = data_dir / "missions.csv"
     missions = load_missions(missions_path)
     
-    mission = None
-    for m in missions:
-        if m.mission_id == mission_id:
-            mission = m
-            break
-    
+    mission = index_missions(missions).get(mission_id)
+
     if mission is None:
         print(f"Mission '{mission_id}' not found.")
         return
@@ -345,42 +408,70 @@ def edit_mission_interactive(data_dir: Path, mission_id: str) -> None:
     print()
     print("Press Enter to keep current value, or enter new value.")
     
+    # Only rewrite the CSV if something actually changed
+    dirty = False
+
     # Name
     new_name = input(f"Name [{mission.name}]: ").strip()
     if new_name:
         mission.name = new_name
-    
+        dirty = True
+
     # Start time
     new_start = input(f"Start datetime [{mission.start.isoformat()}]: ").strip()
     if new_start:
         try:
             mission.start = dt.datetime.fromisoformat(new_start)
+            dirty = True
         except ValueError:
             print("Invalid datetime, keeping current value.")
-    
+
     # End time
     new_end = input(f"End datetime [{mission.end.isoformat()}]: ").strip()
     if new_end:
         try:
             mission.end = dt.datetime.fromisoformat(new_end)
+            dirty = True
         except ValueError:
             print("Invalid datetime, keeping current value.")
-    
+
     # Status
     new_status = input(f"Status [{mission.status}] (planned/started/completed): ").strip()
-    if new_status in ("planned", "started", "completed"):
+    if new_status in _STATUSES:
         mission.status = new_status
-    
+        dirty = True
+
+    if not dirty:
+        print("No changes made.")
+        return
+
     save_missions(missions_path, missions)
     print(f"Mission '{mission_id}' updated.")
 
 
+# Precomputed row templates: format_map on one template string beats several
+# f-string prints per row, and batching through writelines cuts syscalls
+_MISSION_ROW_TMPL = (
+    "ID: {mid}\n"
+    "  Name: {name}\n"
+    "  Time: {start} - {end} ({dur:.1f}h)\n"
+    "  Roles required: {roles}\n"
+)
+
+_TEMPLATE_ROW_TMPL = (
+    "{tid}: {name}\n"
+    "  Time: {start} ({dur}h){instances}{continuous}\n"
+    "  Roles: {roles}\n"
+)
+
+
 def list_missions(data_dir: Path, filter_date: Optional[dt.date] = None) -> None:
     """List missions with optional date filter."""
     missions, _ = load_missions_with_templates(data_dir)
     people = load_people(data_dir / "people.csv")
-    people_by_id = {p.person_id: p for p in people}
-    
+    # Format each person's display string once, not per assignment line
+    display_by_id = {p.person_id: f"{p.name} ({p.phone_number})" for p in people}
+
     if not missions:
         print("No missions found.")
         return
@@ -397,29 +488,28 @@ def list_missions(data_dir: Path, filter_date: Optional[dt.date] = None) -> None
     print(f"\nFound {len(missions)} mission(s):")
     print("-" * 100)
     
+    lines: List[str] = []
     for mission in missions:
-        duration = mission.duration_hours()
-        print(f"ID: {mission.mission_id}")
-        print(f"  Name: {mission.name}")
-        print(f"  Time: {mission.start.strftime('%Y-%m-%d %H:%M')} - {mission.end.strftime('%H:%M')} ({duration:.1f}h)")
-        print(f"  Roles required: {mission.roles_required}")
-        
+        lines.append(_MISSION_ROW_TMPL.format_map({
+            "mid": mission.mission_id,
+            "name": mission.name,
+            "start": mission.start.strftime('%Y-%m-%d %H:%M'),
+            "end": mission.end.strftime('%H:%M'),
+            "dur": mission.duration_hours(),
+            "roles": mission.roles_required,
+        }))
+
         if mission.assignments:
-            print("  Assignments:")
+            lines.append("  Assignments:\n")
             for role, person_ids in mission.assignments.items():
-                person_info = []
-                for pid in person_ids:
-                    p = people_by_id.get(pid)
-                    if p:
-                        person_info.append(f"{p.name} ({p.phone_number})")
-                    else:
-                        person_info.append(pid)
-                print(f"    {role}: {', '.join(person_info)}")
+                person_info = [display_by_id.get(pid, pid) for pid in person_ids]
+                lines.append(f"    {role}: {', '.join(person_info)}\n")
         else:
-            print("  Assignments: none")
-        
-        print(f"  Status: {mission.status}")
-        print()
+            lines.append("  Assignments: none\n")
+
+        lines.append(f"  Status: {mission.status}\n\n")
+
+    sys.stdout.writelines(lines)
 
 
 def generate_missions_cmd(data_dir: Path, start_date: Optional[dt.date] = None, end_date: Optional[dt.date] = None, clear: bool = False) -> None:
@@ -436,65 +526,84 @@ def generate_missions_cmd(data_dir: Path, start_date: Optional[dt.date] = None,
     start = start_date or campaign.start_date
     end = end_date or campaign.end_date
     
-    # Load existing missions or start fresh
+    # Only existing IDs are needed for duplicate detection; streaming the id
+    # column avoids materializing Mission objects for the whole campaign
     if clear:
-        existing_missions = []
         print("Clearing existing missions...")
+        existing_ids = None
     else:
-        existing_missions = load_missions(missions_path)
-    
-    existing_ids = {m.mission_id for m in existing_missions}
+        # Frozenset for fast membership; None means no duplicates are possible
+        loaded_ids = load_mission_ids(missions_path)
+        existing_ids = frozenset(loaded_ids) if loaded_ids else None
     new_missions: List[Mission] = []
     
     print(f"\nGenerating missions from {start} to {end}")
     print(f"Using {len(templates)} templates")
     print("-" * 60)
     
+    # Precompute the day list and flatten every template attribute the inner
+    # loops touch into plain tuples; each day then advances by a whole day
+    # instead of re-combining date and time per mission.
+    one_day = dt.timedelta(days=1)
+    days = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+    per_template = [
+        (dt.datetime.combine(start, t.start_time), dt.timedelta(hours=t.duration_hours),
+         t.template_id, t.name, t.instances, t.roles_required, t.continuous)
+        for t in templates
+    ]
+
+    # Bind hot names as locals for the inner loops
+    make_mission = Mission
+    add_mission = new_missions.append
+
     # Generate missions for each day
-    current_date = start
-    day_num = 0
-    while current_date <= end:
-        day_num += 1
-        
-        for template in templates:
+    day_offset = dt.timedelta(0)
+    for day_num, current_date in enumerate(days, 1):
+        # Format the date and day suffix once per day, not once per mission
+        date_str = current_date.isoformat()
+        day_suffix = f"_day{day_num}"
+
+        for first_start, duration, id_prefix, name_prefix, instances, roles, continuous in per_template:
+            start_datetime = first_start + day_offset
+            end_datetime = start_datetime + duration
+
             # Generate instances
-            for instance in range(1, template.instances + 1):
+            for instance in range(1, instances + 1):
                 # Create mission ID
-                if template.instances > 1:
-                    mission_id = f"{template.template_id}_{instance}_day{day_num}"
-                    mission_name = f"{template.name} #{instance} - {current_date}"
+                if instances > 1:
+                    mission_id = f"{id_prefix}_{instance}{day_suffix}"
+                    mission_name = f"{name_prefix} #{instance} - {date_str}"
                 else:
-                    mission_id = f"{template.template_id}_day{day_num}"
-                    mission_name = f"{template.name} - {current_date}"
-                
+                    mission_id = id_prefix + day_suffix
+                    mission_name = f"{name_prefix} - {date_str}"
+
                 # Skip if already exists
-                if mission_id in existing_ids:
+                if existing_ids is not None and mission_id in existing_ids:
                     continue
-                
-                # Calculate start and end times
-                start_datetime = dt.datetime.combine(current_date, template.start_time)
-                end_datetime = start_datetime + dt.timedelta(hours=template.duration_hours)
-                
-                mission = Mission(
+
+                add_mission(make_mission(
                     mission_id=mission_id,
                     name=mission_name,
                     start=start_datetime,
                     end=end_datetime,
-                    roles_required=template.roles_required.copy(),
+                    roles_required=roles.copy(),
                     status="planned",
                     assignments={},
-                    continuous=template.continuous,
-                )
-                new_missions.append(mission)
-        
-        current_date += dt.timedelta(days=1)
-    
-    # Combine and save
-    all_missions = existing_missions + new_missions
-    save_missions(missions_path, all_missions)
+                    continuous=continuous,
+                ))
+
+        day_offset += one_day
     
+    # Save: rewrite from scratch when clearing, append-only otherwise
+    if clear:
+        save_missions(missions_path, new_missions)
+        total = len(new_missions)
+    else:
+        append_missions(missions_path, new_missions)
+        total = (len(existing_ids) if existing_ids else 0) + len(new_missions)
+
     print(f"Generated {len(new_missions)} new missions")
-    print(f"Total missions: {len(all_missions)}")
+    print(f"Total missions: {total}")
     
     # Summary by template
     print("\nMissions per template:")
@@ -514,15 +623,22 @@ def list_templates_cmd(data_dir: Path) -> None:
     print(f"\nMission Templates ({len(templates)}):")
     print("-" * 100)
     
+    lines: List[str] = []
     for t in templates:
-        continuous_mark = " [CONTINUOUS]" if t.continuous else ""
-        instances_mark = f" x{t.instances}" if t.instances > 1 else ""
-        print(f"{t.template_id}: {t.name}")
-        print(f"  Time: {t.start_time.strftime('%H:%M')} ({t.duration_hours}h){instances_mark}{continuous_mark}")
-        print(f"  Roles: {t.roles_required}")
+        lines.append(_TEMPLATE_ROW_TMPL.format_map({
+            "tid": t.template_id,
+            "name": t.name,
+            "start": t.start_time.strftime('%H:%M'),
+            "dur": t.duration_hours,
+            "instances": f" x{t.instances}" if t.instances > 1 else "",
+            "continuous": " [CONTINUOUS]" if t.continuous else "",
+            "roles": t.roles_required,
+        }))
         if t.notes:
-            print(f"  Notes: {t.notes}")
-        print()
+            lines.append(f"  Notes: {t.notes}\n")
+        lines.append("\n")
+
+    sys.stdout.writelines(lines)
 
 
 # ============================================================================
@@ -536,17 +652,23 @@ def set_vacation_cmd(data_dir: Path, person_id: str, date: dt.date, days: int =
     vacations = load_vacations(vacations_path)
     
     # Find person
-    person = get_person_by_id(people, person_id) or get_person_by_name(people, person_id)
+    person = _find_person(people, person_id)
     if person is None:
         print(f"Person '{person_id}' not found.")
         return
-    
+
     # Add vacation for each day
+    dirty = False
     for i in range(days):
         vacation_date = date + dt.timedelta(days=i)
         vacations = add_vacation(vacations, person.person_id, vacation_date, description)
+        dirty = True
         print(f"  Added vacation: {person.name} on {vacation_date}")
-    
+
+    if not dirty:
+        print("No vacation days to add.")
+        return
+
     save_vacations(vacations_path, vacations)
     print(f"Vacation scheduled for {person.name}: {days} day(s) starting {date}")
 
@@ -557,11 +679,11 @@ def remove_vacation_cmd(data_dir: Path, person_id: str, date: dt.date) -> None:
     vacations_path = data_dir / "vacations.csv"
     vacations = load_vacations(vacations_path)
     
-    person = get_person_by_id(people, person_id) or get_person_by_name(people, person_id)
+    person = _find_person(people, person_id)
     if person is None:
         print(f"Person '{person_id}' not found.")
         return
-    
+
     before_count = len(vacations)
     vacations = remove_vacation(vacations, person.person_id, date)
     
@@ -612,31 +734,25 @@ def add_preference_interactive(data_dir: Path) -> None:
     
     # Get person
     person_input = input("Person ID or name: ").strip()
-    person = get_person_by_id(people, person_input) or get_person_by_name(people, person_input)
+    person = _find_person(people, person_input)
     if person is None:
         print(f"Person '{person_input}' not found.")
         return
     
     # Get type
     pref_type = input("Preference type: ").strip()
-    valid_types = [
-        "rest_multiplier", "pair_with", "avoid_person", "prefer_mission",
-        "avoid_mission", "prefer_weekend", "prefer_weekday",
-        "prefer_vacation_date", "must_vacation_date"
-    ]
-    if pref_type not in valid_types:
-        print(f"Invalid type. Valid types: {', '.join(valid_types)}")
+    if pref_type not in _VALID_PREF_TYPES:
+        print(f"Invalid type. Valid types: {', '.join(sorted(_VALID_PREF_TYPES))}")
         return
-    
+
     # Get target
     target = ""
-    if pref_type in ("rest_multiplier", "pair_with", "avoid_person", "prefer_mission",
-                     "avoid_mission", "prefer_vacation_date", "must_vacation_date"):
+    if pref_type in _TARGETED_PREF_TYPES:
         target = input("Target value: ").strip()
     
     # Get priority
     priority = input("Priority (low/medium/high) [medium]: ").strip() or "medium"
-    if priority not in ("low", "medium", "high"):
+    if priority not in _PRIORITIES:
         priority = "medium"
     
     # Get expiration
@@ -665,33 +781,151 @@ def add_preference_interactive(data_dir: Path) -> None:
 # Assignment Commands
 # ============================================================================
 
+# Matches a " - YYYY-MM-DD" suffix so the common no-date case is rejected
+# without raising/catching ValueError from date parsing.
+_DATE_SUFFIX_RE = re.compile(r" - (\d{4}-\d{2}-\d{2})$")
+
+
+@functools.lru_cache(maxsize=4096)
 def _get_mission_base_name(mission_name: str) -> str:
     """Extract base name from mission name (e.g., 'hapak - 2026-02-19' -> 'hapak')."""
+    # Cheap slice test first: a date suffix is exactly " - YYYY-MM-DD" (13
+    # chars), so names without it never reach the regex engine
+    if len(mission_name) < 13 or mission_name[-13:-10] != " - ":
+        return mission_name
     # Remove date suffix if present
-    if " - " in mission_name:
-        parts = mission_name.rsplit(" - ", 1)
-        # Check if the last part looks like a date
+    match = _DATE_SUFFIX_RE.search(mission_name)
+    if match:
         try:
-            dt.date.fromisoformat(parts[-1])
-            return parts[0]
+            dt.date.fromisoformat(match.group(1))
+            return mission_name[:match.start()]
         except ValueError:
             pass
     return mission_name
 
 
-def _find_previous_day_mission(missions: List[Mission], mission: Mission, prev_date: dt.date) -> Optional[Mission]:
+def _find_previous_day_mission(prev_day_missions: List[Mission], mission: Mission) -> Optional[Mission]:
     """Find yesterday's mission with the same base name."""
     base_name = _get_mission_base_name(mission.name)
-    for m in missions:
-        if m.start.date() == prev_date:
-            if _get_mission_base_name(m.name) == base_name:
-                # Also check similar time slot
-                if m.start.time() == mission.start.time():
-                    return m
+    for m in prev_day_missions:
+        if _get_mission_base_name(m.name) == base_name:
+            # Also check similar time slot
+            if m.start.time() == mission.start.time():
+                return m
     return None
 
 
-def assign_cmd(data_dir: Path, target_date: dt.date, auto_accept: bool = False) -> None:
+# Search-node cap so the exact solver stays responsive on pathological days
+_SOLVER_NODE_LIMIT = 20000
+
+
+def _solve_day_assignments(
+    scheduler: Scheduler, day_missions: List[Mission]
+) -> Optional[List[Tuple[Mission, str, CandidateScore]]]:
+    """
+    Find a minimum-score assignment for all of a day's unfilled slots at once.
+
+    Unlike the greedy per-slot loop, this searches the whole day with
+    minimum-remaining-values ordering and branch-and-bound pruning, so an
+    early pick cannot lock out a later required role.
+
+    Returns a list of (mission, role, candidate) choices, or None if no
+    complete assignment exists (or the search budget ran out first).
+    """
+    slots: List[Tuple[Mission, str]] = []
+    cand_table: List[List[CandidateScore]] = []
+    for mission in day_missions:
+        already = set(mission.all_assigned_people())
+        for role, needed in mission.unfilled_roles().items():
+            candidates = scheduler.get_candidates(mission, role, already)
+            if not candidates:
+                # Nobody can ever fill this role; leave it open rather than
+                # making the whole day infeasible
+                print(f"  [solver] {mission.name}: no candidates for {role}, leaving unfilled")
+                continue
+            for _ in range(needed):
+                slots.append((mission, role))
+                cand_table.append(candidates)
+    if not slots:
+        return []
+
+    # Missions that overlap in time: one person cannot hold both
+    overlaps: Dict[str, set] = {m.mission_id: set() for m in day_missions}
+    for i, m1 in enumerate(day_missions):
+        for m2 in day_missions[i + 1:]:
+            if not (m1.end <= m2.start or m1.start >= m2.end):
+                overlaps[m1.mission_id].add(m2.mission_id)
+                overlaps[m2.mission_id].add(m1.mission_id)
+
+    # person_id -> mission_ids taken in the current partial plan
+    used: Dict[str, set] = {}
+    mission_by_id = {m.mission_id: m for m in day_missions}
+    best_plan: List[Optional[List[Tuple[Mission, str, CandidateScore]]]] = [None]
+    best_score = [float("inf")]
+    nodes = [0]
+
+    def _rest_between(person_id: str, first: Mission, second: Mission) -> bool:
+        """Does the gap between two back-to-back picks satisfy the first's rest?"""
+        multiplier = scheduler.get_rest_multiplier(person_id, second.start.date())
+        needed = min(first.duration_hours(), scheduler.rest_cap_hours) * multiplier
+        return second.start >= first.end + dt.timedelta(hours=needed)
+
+    def _feasible(slot_idx: int, cand: CandidateScore) -> bool:
+        mission, _ = slots[slot_idx]
+        pid = cand.person.person_id
+        taken = used.get(pid)
+        if taken:
+            if mission.mission_id in taken:
+                return False
+            if taken & overlaps[mission.mission_id]:
+                return False
+            # Rest gaps between this pick and the person's other in-plan
+            # picks, in both directions (candidate generation only checked
+            # against assignments that already existed)
+            for other_id in taken:
+                other = mission_by_id[other_id]
+                if other.end <= mission.start:
+                    if not _rest_between(pid, other, mission):
+                        return False
+                elif mission.end <= other.start:
+                    if not _rest_between(pid, mission, other):
+                        return False
+        # Rest against pre-existing assignments, mirroring the greedy path
+        state = scheduler.states.get(pid)
+        return state is None or scheduler._has_enough_rest(state, mission)
+
+    def _search(remaining: List[int], chosen: List, score: float) -> None:
+        nodes[0] += 1
+        if nodes[0] > _SOLVER_NODE_LIMIT or score >= best_score[0]:
+            return
+        if not remaining:
+            best_score[0] = score
+            best_plan[0] = list(chosen)
+            return
+        # MRV: branch on the slot with the fewest feasible candidates
+        branch = None
+        for idx in remaining:
+            feas = [c for c in cand_table[idx] if _feasible(idx, c)]
+            if not feas:
+                return  # dead end, prune
+            if branch is None or len(feas) < len(branch[1]):
+                branch = (idx, feas)
+        idx, feas = branch
+        rest = [i for i in remaining if i != idx]
+        mission, role = slots[idx]
+        for cand in feas:
+            pid = cand.person.person_id
+            used.setdefault(pid, set()).add(mission.mission_id)
+            chosen.append((mission, role, cand))
+            _search(rest, chosen, score + cand.total_score)
+            chosen.pop()
+            used[pid].discard(mission.mission_id)
+
+    _search(list(range(len(slots))), [], 0.0)
+    return best_plan[0]
+
+
+def assign_cmd(data_dir: Path, target_date: dt.date, auto_accept: bool = False, solver: bool = False) -> None:
     """Assign people to missions for a date."""
     campaign = load_campaign(data_dir / "campaign.csv")
     people = load_people(data_dir / "people.csv")
@@ -701,51 +935,106 @@ def assign_cmd(data_dir: Path, target_date: dt.date, auto_accept: bool = False)
     missions, _ = load_missions_with_templates(data_dir)
     
     # Get missions for target date (support old status values: tentative, must)
-    assignable_statuses = {"planned", "tentative", "must"}
-    day_missions = [m for m in missions if m.start.date() == target_date and m.status in assignable_statuses]
-    
+    missions_by_date = index_missions_by_date(missions)
+    day_missions = [m for m in missions_by_date.get(target_date, []) if m.status in _ASSIGNABLE_STATUSES]
+
     if not day_missions:
         print(f"No planned missions found for {target_date}")
         return
-    
+
     # For continuous missions, carry forward yesterday's assignments
     prev_date = target_date - dt.timedelta(days=1)
+    prev_day_missions = missions_by_date.get(prev_date, [])
+    on_vac_today = {v.person_id for v in vacations if v.date == target_date}
     for mission in day_missions:
         if mission.continuous and not mission.assignments:
-            prev_mission = _find_previous_day_mission(missions, mission, prev_date)
+            prev_mission = _find_previous_day_mission(prev_day_missions, mission)
             if prev_mission and prev_mission.assignments:
                 # Copy assignments, excluding people on vacation today
+                # Carry via assign_person so the mission's cached assignment
+                # set stays coherent
                 for role, person_ids in prev_mission.assignments.items():
-                    carried = []
                     for pid in person_ids:
-                        if not is_on_vacation(vacations, pid, target_date):
-                            carried.append(pid)
+                        if pid not in on_vac_today:
+                            mission.assign_person(role, pid)
                             print(f"[Continuous] {mission.name}: Carrying forward {pid} as {role}")
                         else:
                             print(f"[Continuous] {mission.name}: {pid} is on vacation, not carrying forward")
-                    if carried:
-                        mission.assignments[role] = carried
     
     scheduler = Scheduler(people, vacations, preferences, campaign, missions)
     
     print(f"\nAssigning missions for {target_date}")
     print("=" * 80)
-    
+
     changes_made = False
-    
-    for mission in sorted(day_missions, key=lambda m: m.start):
-        unfilled = mission.unfilled_roles()
-        if not unfilled:
+
+    if solver:
+        plan = _solve_day_assignments(scheduler, day_missions)
+        if plan is None:
+            print("Solver found no complete assignment; falling back to greedy selection.")
+        else:
+            for mission, role, cand in plan:
+                scheduler.assign_to_mission(mission, role, cand.person.person_id)
+                print(f"  [solver] {mission.name}: {role} -> {cand.person.name} "
+                      f"(score={cand.total_score:.1f})")
+                changes_made = True
+            if changes_made:
+                save_missions(missions_path, missions)
+                print(f"\nAssignments saved to {missions_path}")
+            else:
+                print("\nNo unfilled slots.")
+            return
+
+    # In auto-accept mode the per-slot candidate scoring is the bottleneck and
+    # each (mission, role) computation is independent, so prefetch them all in
+    # parallel. A prefetched list is only valid while the scheduler state is
+    # untouched: every accepted assignment moves rest windows, overlaps and
+    # fairness, so from the first acceptance onward slots re-score fresh.
+    prefetched: Dict[Tuple[str, str], List[CandidateScore]] = {}
+    if auto_accept:
+        with ThreadPoolExecutor() as executor:
+            futures = {}
+            for mission in day_missions:
+                already = set(mission.all_assigned_people())
+                for role in mission.unfilled_roles():
+                    futures[(mission.mission_id, role)] = executor.submit(
+                        scheduler.get_candidates, mission, role, set(already)
+                    )
+            prefetched = {key: f.result() for key, f in futures.items()}
+
+    # Buckets from index_missions_by_date are already sorted by start time
+    for mission in day_missions:
+        # Compute remaining slots per role once, then decrement plain integers
+        # as assignments land instead of re-deriving through unfilled_roles()
+        remaining = {
+            role: need - len(mission.assignments.get(role, []))
+            for role, need in mission.roles_required.items()
+            if need > len(mission.assignments.get(role, []))
+        }
+        if not remaining:
             continue
         
         print(f"\n{mission.name} ({mission.start.strftime('%H:%M')} - {mission.end.strftime('%H:%M')})")
         print(f"  Current assignments: {mission.assignments or 'none'}")
         
-        for role, needed in unfilled.items():
+        # Maintain the assigned set incrementally instead of rebuilding it
+        # from the mission for every slot
+        already_assigned = set(mission.all_assigned_people())
+        for role, needed in remaining.items():
             for slot in range(needed):
-                already_assigned = set(mission.all_assigned_people())
-                candidates = scheduler.get_candidates(mission, role, already_assigned)
-                
+                # Stale prefetches are discarded outright: re-filtering them
+                # cannot reproduce what a fresh scan would return (rest and
+                # score changes can both admit and evict candidates)
+                cached = None if changes_made else prefetched.get((mission.mission_id, role))
+                if cached is not None:
+                    candidates = cached
+                else:
+                    # Only the top five are ever shown or selectable, so let
+                    # the scheduler prune the rest during scoring
+                    candidates = scheduler.get_candidates(
+                        mission, role, already_assigned, top_k=5
+                    )
+
                 if not candidates:
                     print(f"  [{role} #{slot+1}] No candidates available!")
                     continue
@@ -773,6 +1062,8 @@ def assign_cmd(data_dir: Path, target_date: dt.date, auto_accept: bool = False)
                 
                 selected = candidates[choice - 1]
                 scheduler.assign_to_mission(mission, role, selected.person.person_id)
+                already_assigned.add(selected.person.person_id)
+                remaining[role] -= 1
                 print(f"  Assigned: {selected.person.name}")
                 changes_made = True
     
@@ -789,33 +1080,33 @@ def assign_cmd(data_dir: Path, target_date: dt.date, auto_accept: bool = False)
 
 def view_date_cmd(data_dir: Path, target_date: dt.date) -> None:
     """View missions, assignments, and vacations for a date."""
-    people = load_people(data_dir / "people.csv")
-    missions, _ = load_missions_with_templates(data_dir)
-    vacations = load_vacations(data_dir / "vacations.csv")
-    
-    people_by_id = {p.person_id: p for p in people}
+    people, (missions, _), vacations = _load_all(data_dir)
     
-    print(f"\n{'='*80}")
-    print(f"  DATE: {target_date} ({target_date.strftime('%A')})")
-    print(f"{'='*80}")
+    people_by_id, _ = _index_people(people)
     
+    # Accumulate the whole report and flush once instead of a print per line
+    out: List[str] = []
+    out.append(f"\n{'='*80}\n")
+    out.append(f"  DATE: {target_date} ({target_date.strftime('%A')})\n")
+    out.append(f"{'='*80}\n")
+
     # Missions
-    day_missions = get_missions_for_date(missions, target_date)
-    day_missions.sort(key=lambda m: m.start)
-    
-    print(f"\nMISSIONS ({len(day_missions)}):")
-    print("-" * 80)
-    
+    # Pre-sorted by start time at index-build time
+    day_missions = index_missions_by_date(missions).get(target_date, [])
+
+    out.append(f"\nMISSIONS ({len(day_missions)}):\n")
+    out.append("-" * 80 + "\n")
+
     if not day_missions:
-        print("  No missions scheduled.")
-    
+        out.append("  No missions scheduled.\n")
+
     for mission in day_missions:
-        print(f"\n  {mission.name}")
-        print(f"  Time: {mission.start.strftime('%H:%M')} - {mission.end.strftime('%H:%M')} | Status: {mission.status}")
-        print(f"  Required: {mission.roles_required}")
-        
+        out.append(f"\n  {mission.name}\n")
+        out.append(f"  Time: {mission.start.strftime('%H:%M')} - {mission.end.strftime('%H:%M')} | Status: {mission.status}\n")
+        out.append(f"  Required: {mission.roles_required}\n")
+
         if mission.assignments:
-            print("  Assigned:")
+            out.append("  Assigned:\n")
             for role, person_ids in mission.assignments.items():
                 person_info = []
                 for pid in person_ids:
@@ -824,22 +1115,22 @@ def view_date_cmd(data_dir: Path, target_date: dt.date) -> None:
                         person_info.append(f"{p.name} ({p.phone_number})")
                     else:
                         person_info.append(pid)
-                print(f"    {role}: {', '.join(person_info)}")
+                out.append(f"    {role}: {', '.join(person_info)}\n")
         else:
-            print("  Assigned: (none)")
-        
+            out.append("  Assigned: (none)\n")
+
         unfilled = mission.unfilled_roles()
         if unfilled:
-            print(f"  UNFILLED: {unfilled}")
-    
+            out.append(f"  UNFILLED: {unfilled}\n")
+
     # Vacations
     day_vacations = get_vacations_for_date(vacations, target_date)
-    
-    print(f"\n\nVACATIONS ({len(day_vacations)}):")
-    print("-" * 80)
-    
+
+    out.append(f"\n\nVACATIONS ({len(day_vacations)}):\n")
+    out.append("-" * 80 + "\n")
+
     if not day_vacations:
-        print("  No one on vacation.")
+        out.append("  No one on vacation.\n")
     else:
         for vacation in day_vacations:
             person = people_by_id.get(vacation.person_id)
@@ -850,9 +1141,10 @@ def view_date_cmd(data_dir: Path, target_date: dt.date) -> None:
                 info = vacation.person_id
                 role = "?"
             desc = f" - {vacation.description}" if vacation.description else ""
-            print(f"  {info} [{role}]{desc}")
-    
-    print()
+            out.append(f"  {info} [{role}]{desc}\n")
+
+    out.append("\n")
+    sys.stdout.writelines(out)
 
 
 # ============================================================================
@@ -866,69 +1158,74 @@ def report_date_cmd(data_dir: Path, target_date: dt.date, strict: bool = False)
     Non-strict: Person is on vacation if they slept at home (have vacation entry)
     Strict: Person is on vacation only if slept at home AND had no mission
     """
-    people = load_people(data_dir / "people.csv")
-    missions, _ = load_missions_with_templates(data_dir)
-    vacations = load_vacations(data_dir / "vacations.csv")
-    
-    people_by_id = {p.person_id: p for p in people}
-    
+    people, (missions, _), vacations = _load_all(data_dir)
+
+    people_by_id, _ = _index_people(people)
+
     # Get mission assignments for this date
     day_missions = get_missions_for_date(missions, target_date)
     assigned_people = set()
     for mission in day_missions:
-        if mission.status in ("started", "completed"):  # Only count actual missions
-            assigned_people.update(mission.all_assigned_people())
-    
-    on_site = []
-    on_vacation = []
+        if mission.status in _ACTIVE_STATUSES:  # Only count actual missions
+            assigned_people.update(mission.assigned_set())
     
+    # Index vacations once; per-person checks are then set membership
+    vacations_by_date, _ = build_vacation_index(vacations)
+    home_today = vacations_by_date.get(target_date, set())
+
+    # Classify and group by role in a single pass over people
+    by_name = attrgetter('name')
+    on_site_by_role: Dict[str, List[Person]] = defaultdict(list)
+    on_vacation: List[Person] = []
+
     for person in people:
-        has_vacation = is_on_vacation(vacations, person.person_id, target_date)
+        has_vacation = person.person_id in home_today
         had_mission = person.person_id in assigned_people
-        
+
         if strict:
             # Vacation only if slept home AND no mission
             is_vacation = has_vacation and not had_mission
         else:
             # Vacation if slept home (regardless of mission)
             is_vacation = has_vacation
-        
+
         if is_vacation:
             on_vacation.append(person)
         else:
-            on_site.append(person)
-    
+            on_site_by_role[person.role].append(person)
+
+    on_site_total = sum(len(persons) for persons in on_site_by_role.values())
+
     mode = "strict" if strict else "standard"
-    print(f"\nAttendance Report for {target_date} ({mode} mode)")
-    print("=" * 60)
-    
-    print(f"\nON SITE ({len(on_site)}):")
-    print("-" * 40)
-    by_role: Dict[str, List[Person]] = {}
-    for p in on_site:
-        by_role.setdefault(p.role, []).append(p)
-    for role, persons in sorted(by_role.items()):
-        print(f"  {role}: {len(persons)}")
-        for p in sorted(persons, key=lambda x: x.name):
-            print(f"    - {p.name} ({p.unit})")
-    
-    print(f"\nON VACATION ({len(on_vacation)}):")
-    print("-" * 40)
-    for p in sorted(on_vacation, key=lambda x: x.name):
-        print(f"  - {p.name} ({p.role}, {p.unit})")
-    
-    print()
+    out: List[str] = []
+    out.append(f"\nAttendance Report for {target_date} ({mode} mode)\n")
+    out.append("=" * 60 + "\n")
+
+    out.append(f"\nON SITE ({on_site_total}):\n")
+    out.append("-" * 40 + "\n")
+    for role, persons in sorted(on_site_by_role.items()):
+        out.append(f"  {role}: {len(persons)}\n")
+        persons.sort(key=by_name)
+        for p in persons:
+            out.append(f"    - {p.name} ({p.unit})\n")
+
+    out.append(f"\nON VACATION ({len(on_vacation)}):\n")
+    out.append("-" * 40 + "\n")
+    on_vacation.sort(key=by_name)
+    for p in on_vacation:
+        out.append(f"  - {p.name} ({p.role}, {p.unit})\n")
+
+    out.append("\n")
+    sys.stdout.writelines(out)
 
 
 def report_person_cmd(data_dir: Path, person_id: Optional[str] = None) -> None:
     """Report per-person statistics."""
-    people = load_people(data_dir / "people.csv")
-    missions, _ = load_missions_with_templates(data_dir)
-    vacations = load_vacations(data_dir / "vacations.csv")
-    
+    people, (missions, _), vacations = _load_all(data_dir)
+
     # Filter to specific person if requested
     if person_id:
-        person = get_person_by_id(people, person_id) or get_person_by_name(people, person_id)
+        person = _find_person(people, person_id)
         if person is None:
             print(f"Person '{person_id}' not found.")
             return
@@ -939,19 +1236,21 @@ def report_person_cmd(data_dir: Path, person_id: Optional[str] = None) -> None:
     print(f"{'Name':<20} {'Role':<12} {'Unit':<10} {'Missions':<10} {'Hours':<10} {'Vacations'}")
     print("-" * 80)
     
+    # Aggregate mission counts/hours per person in one pass over missions
+    # instead of rescanning all missions for every person
+    stats: Dict[str, Tuple[int, float]] = {}
+    for mission in missions:
+        if mission.status in _ACTIVE_STATUSES:
+            hours = mission.duration_hours()
+            for pid in mission.all_assigned_people():
+                s = stats.get(pid)
+                stats[pid] = (s[0] + 1, s[1] + hours) if s else (1, hours)
+    vac_counts = Counter(v.person_id for v in vacations)
+
     for person in sorted(people, key=lambda p: (p.role, p.name)):
-        # Count completed missions
-        mission_count = 0
-        total_hours = 0.0
-        for mission in missions:
-            if mission.status in ("started", "completed"):
-                if person.person_id in mission.all_assigned_people():
-                    mission_count += 1
-                    total_hours += mission.duration_hours()
-        
-        # Count vacation days
-        vacation_count = sum(1 for v in vacations if v.person_id == person.person_id)
-        
+        mission_count, total_hours = stats.get(person.person_id, (0, 0.0))
+        vacation_count = vac_counts[person.person_id]
+
         print(f"{person.name:<20} {person.role:<12} {person.unit:<10} {mission_count:<10} {total_hours:<10.1f} {vacation_count}")
     
     print("-" * 80)
@@ -959,41 +1258,46 @@ def report_person_cmd(data_dir: Path, person_id: Optional[str] = None) -> None:
 
 def vacation_summary_cmd(data_dir: Path) -> None:
     """Show daily vacation summary table with returning/leaving details."""
-    from collections import defaultdict
-    
-    campaign = load_campaign(data_dir / "campaign.csv")
-    people = load_people(data_dir / "people.csv")
-    vacations = load_vacations(data_dir / "vacations.csv")
+    # Same parallel-load idea as _load_all, but this command needs the
+    # campaign instead of missions
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        campaign_f = pool.submit(load_campaign, data_dir / "campaign.csv")
+        people_f = pool.submit(load_people, data_dir / "people.csv")
+        vacations_f = pool.submit(load_vacations, data_dir / "vacations.csv")
+        campaign = campaign_f.result()
+        people = people_f.result()
+        vacations = vacations_f.result()
     
     # Filter to units 1-3 only
     people = [p for p in people if p.unit in ['1', '2', '3']]
-    people_by_id = {p.person_id: p for p in people}
+    people_by_id, _ = _index_people(people)
     valid_ids = set(people_by_id.keys())
     
-    # Build vacation lookup by date
-    vacation_dates: Dict[str, set] = defaultdict(set)
+    # Build vacation lookup by date (dt.date keys; format only when printing)
+    vacation_dates: Dict[dt.date, set] = defaultdict(set)
     for v in vacations:
         if v.person_id in valid_ids:
-            vacation_dates[v.date.isoformat()].add(v.person_id)
-    
-    # Effective role mapping (medics = soldiers, cmd+off+samal = command)
-    def get_effective_role(person: Person) -> str:
-        if person.role in ['medic', 'soldier']:
-            return 'soldier'
-        elif person.role in ['commander', 'officer', 'samal']:
-            return 'command'
-        return person.role
+            vacation_dates[v.date].add(v.person_id)
     
     # Required on-site
     REQUIRED = {'soldier': 27, 'command': 7}
-    
-    # Generate all dates
-    all_dates = []
-    current = campaign.start_date
-    while current <= campaign.end_date:
-        all_dates.append(current.isoformat())
-        current += dt.timedelta(days=1)
-    
+
+    # Classify each person's effective role once via the module-level table;
+    # the per-date counts below are then C-level set intersections instead
+    # of per-person scans
+    role_table = _EFFECTIVE_ROLE.get
+    eff_role = {pid: role_table(p.role, p.role) for pid, p in people_by_id.items()}
+    soldier_ids = frozenset(pid for pid, r in eff_role.items() if r == 'soldier')
+    command_ids = frozenset(pid for pid, r in eff_role.items() if r == 'command')
+    n_soldiers, n_command = len(soldier_ids), len(command_ids)
+
+    # Generate all dates as date objects; no serialize/reparse round-trip
+    span = (campaign.end_date - campaign.start_date).days + 1
+    all_dates = [campaign.start_date + dt.timedelta(days=i) for i in range(span)]
+
+    # First names computed once; format_people runs twice per date
+    first_names = {p.person_id: p.name.split(None, 1)[0] for p in people}
+
     # Helper to format people list
     def format_people(pids: set, limit: int = 3) -> str:
         if not pids:
@@ -1001,8 +1305,7 @@ def vacation_summary_cmd(data_dir: Path) -> None:
         by_unit: Dict[str, List[str]] = defaultdict(list)
         for pid in pids:
             if pid in people_by_id:
-                p = people_by_id[pid]
-                by_unit[p.unit].append(p.name.split()[0])
+                by_unit[people_by_id[pid].unit].append(first_names[pid])
         
         parts = []
         for unit in sorted(by_unit.keys()):
@@ -1013,77 +1316,71 @@ def vacation_summary_cmd(data_dir: Path) -> None:
                 parts.append(f"U{unit}:{len(names)} ppl")
         return ' '.join(parts)
     
-    # Print header
-    print("\n" + "=" * 140)
-    print("DAILY VACATION SUMMARY")
-    print("=" * 140)
-    print(f"\n{'Date':<12} {'Day':<4} │{'Home':>5} {'Site':>5}│{'Sol':>4} {'Cmd':>4}│ {'Returning':<40} {'Leaving':<40}")
-    print("-" * 140)
-    
+    # Accumulate the whole summary and flush once instead of a print per line
+    out: List[str] = []
+    out.append("\n" + "=" * 140)
+    out.append("DAILY VACATION SUMMARY")
+    out.append("=" * 140)
+    out.append(f"\n{'Date':<12} {'Day':<4} │{'Home':>5} {'Site':>5}│{'Sol':>4} {'Cmd':>4}│ {'Returning':<40} {'Leaving':<40}")
+    out.append("-" * 140)
+
     prev_home: set = set()
-    for date_str in all_dates:
-        d = dt.date.fromisoformat(date_str)
-        dow = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][d.weekday()]
-        
-        home_today = vacation_dates.get(date_str, set())
+    violations: List[str] = []
+    for d in all_dates:
+        date_str = d.isoformat()
+        dow = _WEEKDAYS[d.weekday()]
+
+        home_today = vacation_dates.get(d, set())
         on_site = valid_ids - home_today
-        
-        # Count by effective role on site
-        sol = sum(1 for pid in on_site if get_effective_role(people_by_id[pid]) == 'soldier')
-        cmd = sum(1 for pid in on_site if get_effective_role(people_by_id[pid]) == 'command')
-        
+
+        # Count by effective role on site via set intersections
+        sol = n_soldiers - len(soldier_ids & home_today)
+        cmd = n_command - len(command_ids & home_today)
+
         # Returning (was home yesterday, on site today)
         returning = prev_home - home_today
         # Leaving (was on site yesterday, home today)
         leaving = home_today - prev_home
-        
+
         ret_str = format_people(returning)
         lvg_str = format_people(leaving)
-        
-        # Constraint check
-        sol_ok = "✓" if sol >= REQUIRED['soldier'] else f"!{sol}"
-        cmd_ok = "✓" if cmd >= REQUIRED['command'] else f"!{cmd}"
-        
-        print(f"{date_str:<12} {dow:<4} │{len(home_today):>5} {len(on_site):>5}│{sol:>4} {cmd:>4}│ {ret_str:<40} {lvg_str:<40}")
-        
+
+        # Constraint check (collected here so no second date pass is needed)
+        if sol < REQUIRED['soldier']:
+            violations.append(f"{date_str}: {sol} soldiers")
+        if cmd < REQUIRED['command']:
+            violations.append(f"{date_str}: {cmd} command")
+
+        out.append(f"{date_str:<12} {dow:<4} │{len(home_today):>5} {len(on_site):>5}│{sol:>4} {cmd:>4}│ {ret_str:<40} {lvg_str:<40}")
+
         prev_home = home_today
-    
+
     # Summary by effective role
-    print("\n" + "=" * 140)
-    print("VACATION DAYS BY ROLE")
-    print("=" * 140)
-    
+    out.append("\n" + "=" * 140)
+    out.append("VACATION DAYS BY ROLE")
+    out.append("=" * 140)
+
+    vac_counts = Counter(v.person_id for v in vacations)
     by_eff_role: Dict[str, List[tuple]] = defaultdict(list)
     for p in people:
-        eff_role = get_effective_role(p)
-        vac_count = sum(1 for v in vacations if v.person_id == p.person_id)
-        by_eff_role[eff_role].append((p.name, vac_count))
+        by_eff_role[eff_role[p.person_id]].append((p.name, vac_counts[p.person_id]))
     
     for role in ['soldier', 'command']:
         persons = by_eff_role.get(role, [])
         if persons:
             days = [d for _, d in persons]
-            print(f"\n{role.upper()} ({len(persons)} people):")
-            print(f"  Vacation days: min={min(days)}, max={max(days)}, avg={sum(days)/len(days):.1f}")
-    
-    # Constraint check
-    violations = []
-    for date_str in all_dates:
-        home = vacation_dates.get(date_str, set())
-        on_site = valid_ids - home
-        sol = sum(1 for pid in on_site if get_effective_role(people_by_id[pid]) == 'soldier')
-        cmd = sum(1 for pid in on_site if get_effective_role(people_by_id[pid]) == 'command')
-        if sol < REQUIRED['soldier']:
-            violations.append(f"{date_str}: {sol} soldiers")
-        if cmd < REQUIRED['command']:
-            violations.append(f"{date_str}: {cmd} command")
-    
+            out.append(f"\n{role.upper()} ({len(persons)} people):")
+            out.append(f"  Vacation days: min={min(days)}, max={max(days)}, avg={sum(days)/len(days):.1f}")
+
+    # Constraint check (violations collected during the main table pass)
     if violations:
-        print(f"\n⚠️ {len(violations)} constraint violations!")
+        out.append(f"\n⚠️ {len(violations)} constraint violations!")
         for v in violations[:5]:
-            print(f"  {v}")
+            out.append(f"  {v}")
     else:
-        print("\n✅ All days meet staffing requirements!")
+        out.append("\n✅ All days meet staffing requirements!")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 # ============================================================================
@@ -1106,110 +1403,90 @@ def main() -> None:
         help="Root directory containing campaign folders",
     )
     
-    # Commands
-    parser.add_argument("--add-mission", action="store_true", help="Add a new mission interactively")
-    parser.add_argument("--edit-mission", metavar="ID", help="Edit a mission by ID")
-    parser.add_argument("--get-missions", action="store_true", help="List missions")
-    parser.add_argument("--get-templates", action="store_true", help="List mission templates")
-    parser.add_argument("--generate-missions", action="store_true", help="Generate missions from templates")
-    parser.add_argument("--clear", action="store_true", help="Clear existing missions when generating")
-    
-    parser.add_argument("--set-vacation", action="store_true", help="Set vacation for a person")
-    parser.add_argument("--remove-vacation", action="store_true", help="Remove vacation for a person")
-    parser.add_argument("--plan-vacations", action="store_true", help="Suggest vacation candidates")
-    
-    parser.add_argument("--add-preference", action="store_true", help="Add a preference interactively")
-    
-    parser.add_argument("--assign", action="store_true", help="Assign people to missions for a date")
-    parser.add_argument("-Y", action="store_true", dest="auto_accept", help="Auto-accept assignment suggestions")
-    
-    parser.add_argument("--view", action="store_true", help="View missions and assignments for a date")
-    
-    parser.add_argument("--report", action="store_true", help="Attendance report for a date")
-    parser.add_argument("--strict", action="store_true", help="Strict vacation counting (no mission = vacation)")
-    
-    parser.add_argument("--report-person", action="store_true", help="Per-person statistics")
-    parser.add_argument("--vacation-summary", action="store_true", help="Daily vacation summary table")
-    
-    # Common arguments
-    parser.add_argument("--date", type=dt.date.fromisoformat, help="Target date (YYYY-MM-DD)")
-    parser.add_argument("--start", type=dt.date.fromisoformat, help="Start date for range (YYYY-MM-DD)")
-    parser.add_argument("--end", type=dt.date.fromisoformat, help="End date for range (YYYY-MM-DD)")
-    parser.add_argument("--person", help="Person ID or name")
-    parser.add_argument("--days", type=int, default=1, help="Number of days (for vacation)")
-    parser.add_argument("--desc", default="", help="Description (for vacation)")
-    
+    # Subcommands: only the requested command's arguments are registered and
+    # required-argument validation is declarative instead of if/elif checks
+    sub = parser.add_subparsers(dest="cmd", metavar="COMMAND")
+    iso_date = dt.date.fromisoformat
+
+    sub.add_parser("add-mission", help="Add a new mission interactively")
+
+    p = sub.add_parser("edit-mission", help="Edit a mission by ID")
+    p.add_argument("mission_id", metavar="ID", help="Mission ID to edit")
+
+    p = sub.add_parser("get-missions", help="List missions")
+    p.add_argument("--date", type=iso_date, help="Filter by date (YYYY-MM-DD)")
+
+    sub.add_parser("get-templates", help="List mission templates")
+
+    p = sub.add_parser("generate-missions", help="Generate missions from templates")
+    p.add_argument("--start", type=iso_date, help="Start date for range (YYYY-MM-DD)")
+    p.add_argument("--end", type=iso_date, help="End date for range (YYYY-MM-DD)")
+    p.add_argument("--clear", action="store_true", help="Clear existing missions when generating")
+
+    p = sub.add_parser("set-vacation", help="Set vacation for a person")
+    p.add_argument("--person", required=True, help="Person ID or name")
+    p.add_argument("--date", required=True, type=iso_date, help="First vacation day (YYYY-MM-DD)")
+    p.add_argument("--days", type=int, default=1, help="Number of days")
+    p.add_argument("--desc", default="", help="Description")
+
+    p = sub.add_parser("remove-vacation", help="Remove vacation for a person")
+    p.add_argument("--person", required=True, help="Person ID or name")
+    p.add_argument("--date", required=True, type=iso_date, help="Vacation day (YYYY-MM-DD)")
+
+    p = sub.add_parser("plan-vacations", help="Suggest vacation candidates")
+    p.add_argument("--date", required=True, type=iso_date, help="Start date (YYYY-MM-DD)")
+    p.add_argument("--days", type=int, default=1, help="Number of days")
+
+    sub.add_parser("add-preference", help="Add a preference interactively")
+
+    p = sub.add_parser("assign", help="Assign people to missions for a date")
+    p.add_argument("--date", required=True, type=iso_date, help="Target date (YYYY-MM-DD)")
+    p.add_argument("-Y", action="store_true", dest="auto_accept", help="Auto-accept assignment suggestions")
+    p.add_argument("--solver", action="store_true", help="Solve the whole day's assignments at once instead of greedy per-slot selection")
+
+    p = sub.add_parser("view", help="View missions and assignments for a date")
+    p.add_argument("--date", required=True, type=iso_date, help="Target date (YYYY-MM-DD)")
+
+    p = sub.add_parser("report", help="Attendance report for a date")
+    p.add_argument("--date", required=True, type=iso_date, help="Target date (YYYY-MM-DD)")
+    p.add_argument("--strict", action="store_true", help="Strict vacation counting (no mission = vacation)")
+
+    p = sub.add_parser("report-person", help="Per-person statistics")
+    p.add_argument("--person", help="Person ID or name")
+
+    sub.add_parser("vacation-summary", help="Daily vacation summary table")
+
     args = parser.parse_args()
     data_dir = args.data_root / args.name
-    
+
     # Ensure campaign exists for most commands
-    if not args.add_mission:
+    if args.cmd != "add-mission":
         data_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Route to command
-    if args.add_mission:
-        add_mission_interactive(data_dir)
-    
-    elif args.edit_mission:
-        edit_mission_interactive(data_dir, args.edit_mission)
-    
-    elif args.get_missions:
-        list_missions(data_dir, filter_date=args.date)
-    
-    elif args.get_templates:
-        list_templates_cmd(data_dir)
-    
-    elif args.generate_missions:
-        generate_missions_cmd(data_dir, args.start, args.end, args.clear)
-    
-    elif args.set_vacation:
-        if not args.person or not args.date:
-            print("--set-vacation requires --person and --date")
-            return
-        set_vacation_cmd(data_dir, args.person, args.date, args.days, args.desc)
-    
-    elif args.remove_vacation:
-        if not args.person or not args.date:
-            print("--remove-vacation requires --person and --date")
-            return
-        remove_vacation_cmd(data_dir, args.person, args.date)
-    
-    elif args.plan_vacations:
-        if not args.date:
-            print("--plan-vacations requires --date")
-            return
-        plan_vacations_cmd(data_dir, args.date, args.days)
-    
-    elif args.add_preference:
-        add_preference_interactive(data_dir)
-    
-    elif args.assign:
-        if not args.date:
-            print("--assign requires --date")
-            return
-        assign_cmd(data_dir, args.date, args.auto_accept)
-    
-    elif args.view:
-        if not args.date:
-            print("--view requires --date")
-            return
-        view_date_cmd(data_dir, args.date)
-    
-    elif args.report:
-        if not args.date:
-            print("--report requires --date")
-            return
-        report_date_cmd(data_dir, args.date, args.strict)
-    
-    elif args.report_person:
-        report_person_cmd(data_dir, args.person)
-    
-    elif args.vacation_summary:
-        vacation_summary_cmd(data_dir)
-    
-    else:
+
+    # Route to command via dispatch table
+    commands = {
+        "add-mission": lambda a: add_mission_interactive(data_dir),
+        "edit-mission": lambda a: edit_mission_interactive(data_dir, a.mission_id),
+        "get-missions": lambda a: list_missions(data_dir, filter_date=a.date),
+        "get-templates": lambda a: list_templates_cmd(data_dir),
+        "generate-missions": lambda a: generate_missions_cmd(data_dir, a.start, a.end, a.clear),
+        "set-vacation": lambda a: set_vacation_cmd(data_dir, a.person, a.date, a.days, a.desc),
+        "remove-vacation": lambda a: remove_vacation_cmd(data_dir, a.person, a.date),
+        "plan-vacations": lambda a: plan_vacations_cmd(data_dir, a.date, a.days),
+        "add-preference": lambda a: add_preference_interactive(data_dir),
+        "assign": lambda a: assign_cmd(data_dir, a.date, a.auto_accept, solver=a.solver),
+        "view": lambda a: view_date_cmd(data_dir, a.date),
+        "report": lambda a: report_date_cmd(data_dir, a.date, a.strict),
+        "report-person": lambda a: report_person_cmd(data_dir, a.person),
+        "vacation-summary": lambda a: vacation_summary_cmd(data_dir),
+    }
+
+    handler = commands.get(args.cmd)
+    if handler is None:
         # Default: initialize campaign (create missing files)
         init_campaign(data_dir, args.name)
+    else:
+        handler(args)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import csv
 import datetime as dt
+import io
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .data_models import (
     Campaign,
@@ -17,31 +19,118 @@ from .data_models import (
 )
 
 
+# ============================================================================
+# Load cache
+# ============================================================================
+
+# Parsed results keyed by resolved path, so equivalent spellings of the same
+# file share one entry; entries carry (mtime_ns, size, extra_key) so a changed
+# file misses automatically. save_* functions also invalidate eagerly.
+_LOAD_CACHE: Dict[str, Tuple[int, int, object, object]] = {}
+
+
+def _cache_key(path: Path) -> str:
+    """Canonical cache key for a path (symlinks and relative parts resolved)."""
+    return os.path.realpath(path)
+
+
+def _cache_get(path: Path, extra_key: object = None):
+    """Return the cached parse for path if the file is unchanged, else None."""
+    entry = _LOAD_CACHE.get(_cache_key(path))
+    if entry is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if entry[0] == st.st_mtime_ns and entry[1] == st.st_size and entry[2] == extra_key:
+        return entry[3]
+    return None
+
+
+def _cache_put(path: Path, result: object, extra_key: object = None) -> None:
+    """Store a parsed result for path, keyed by the file's current stat."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    _LOAD_CACHE[_cache_key(path)] = (st.st_mtime_ns, st.st_size, extra_key, result)
+
+
+def _cache_invalidate(path: Path) -> None:
+    """Drop any cached parse for path (called by save_* functions)."""
+    _LOAD_CACHE.pop(_cache_key(path), None)
+
+
+def _cell(row: List[str], i: Optional[int], default: str = "") -> str:
+    """Positional row access with DictReader-like missing-column defaults."""
+    return row[i] if i is not None and i < len(row) else default
+
+
+# Directories already created this process; lets save_* skip the mkdir syscall
+# on repeat writes into the same campaign directory
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_parent_dir(path: Path) -> None:
+    """mkdir -p the file's directory, at most once per directory per process."""
+    parent = str(path.parent)
+    if parent not in _ensured_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
+# Truthy spellings for boolean-ish CSV cells; covering case variants up front
+# makes the per-row check a single set lookup with no .lower() allocation
+_TRUE_STRINGS = frozenset({
+    "true", "1", "yes", "True", "TRUE", "Yes", "YES",
+})
+
+
 # ============================================================================
 # Campaign
 # ============================================================================
 
+def _copy_campaign(campaign: Campaign) -> Campaign:
+    """Fresh Campaign with its own estimates dict (the only mutable field)."""
+    return Campaign(
+        name=campaign.name,
+        start_date=campaign.start_date,
+        end_date=campaign.end_date,
+        on_duty_estimates=dict(campaign.on_duty_estimates),
+        rest_cap_hours=campaign.rest_cap_hours,
+    )
+
+
 def load_campaign(path: Path) -> Campaign:
     """Load campaign from CSV file."""
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    if not rows:
+    cached = _cache_get(path)
+    if cached is not None:
+        return _copy_campaign(cached)
+    with path.open(newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        row = next(reader, None)
+    if header is None or row is None:
         raise ValueError("campaign.csv is empty")
-    row = rows[0]
-    estimates = parse_roles_json(row["on_duty_estimates"])
-    return Campaign(
-        name=row["name"],
-        start_date=dt.date.fromisoformat(row["start_date"]),
-        end_date=dt.date.fromisoformat(row["end_date"]),
+    idx = {name: i for i, name in enumerate(header)}
+    rest_i = idx.get("rest_cap_hours")
+    estimates = parse_roles_json(row[idx["on_duty_estimates"]])
+    campaign = Campaign(
+        name=row[idx["name"]],
+        start_date=dt.date.fromisoformat(row[idx["start_date"]]),
+        end_date=dt.date.fromisoformat(row[idx["end_date"]]),
         on_duty_estimates=estimates,
-        rest_cap_hours=int(row.get("rest_cap_hours", 12)),
+        rest_cap_hours=int(_cell(row, rest_i, "12") or 12),
     )
+    _cache_put(path, campaign)
+    return _copy_campaign(campaign)
 
 
 def save_campaign(path: Path, campaign: Campaign) -> None:
     """Save campaign to CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
     fieldnames = ["name", "start_date", "end_date", "on_duty_estimates", "rest_cap_hours"]
     with path.open("w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -61,44 +150,65 @@ def save_campaign(path: Path, campaign: Campaign) -> None:
 
 def load_people(path: Path) -> List[Person]:
     """Load people from CSV file."""
-    if not path.exists():
+    cached = _cache_get(path)
+    if cached is not None:
+        return list(cached)
+    # Single read attempt: one open syscall instead of an exists() stat + open
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         _create_empty_csv(path, ["id", "name", "phone_number", "role", "unit", "secondary_roles"])
         return []
-    
+
+    # csv.reader with fixed column indexes over a single whole-file read:
+    # no per-row dict construction and no small buffered reads
     people: List[Person] = []
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            secondary_roles = [
-                r.strip() for r in row.get("secondary_roles", "").split(",") if r.strip()
-            ]
-            people.append(Person(
-                person_id=row["id"],
-                name=row["name"],
-                phone_number=row.get("phone_number", ""),
-                role=row["role"],
-                unit=row["unit"],
-                secondary_roles=secondary_roles,
-            ))
-    return people
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        return []
+    idx = {name: i for i, name in enumerate(header)}
+    id_i, name_i = idx["id"], idx["name"]
+    role_i, unit_i = idx["role"], idx["unit"]
+    phone_i = idx.get("phone_number")
+    sec_i = idx.get("secondary_roles")
+    for row in reader:
+        if not row:
+            continue
+        secondary_roles = [
+            r.strip() for r in _cell(row, sec_i).split(",") if r.strip()
+        ]
+        people.append(Person(
+            person_id=row[id_i],
+            name=row[name_i],
+            phone_number=_cell(row, phone_i),
+            role=row[role_i],
+            unit=row[unit_i],
+            secondary_roles=secondary_roles,
+        ))
+    _cache_put(path, people)
+    return list(people)
 
 
 def save_people(path: Path, people: List[Person]) -> None:
     """Save people to CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
     fieldnames = ["id", "name", "phone_number", "role", "unit", "secondary_roles"]
     with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for person in people:
-            writer.writerow({
-                "id": person.person_id,
-                "name": person.name,
-                "phone_number": person.phone_number,
-                "role": person.role,
-                "unit": person.unit,
-                "secondary_roles": ",".join(person.secondary_roles),
-            })
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                person.person_id,
+                person.name,
+                person.phone_number,
+                person.role,
+                person.unit,
+                ",".join(person.secondary_roles),
+            )
+            for person in people
+        )
 
 
 def get_person_by_id(people: List[Person], person_id: str) -> Optional[Person]:
@@ -118,88 +228,190 @@ def get_person_by_name(people: List[Person], name: str) -> Optional[Person]:
     return None
 
 
+def index_people(people: List[Person]) -> Dict[str, Person]:
+    """Build an id -> Person dict for O(1) lookups instead of linear scans."""
+    return {p.person_id: p for p in people}
+
+
 # ============================================================================
 # Missions
 # ============================================================================
 
+def _copy_mission(mission: Mission) -> Mission:
+    """Fresh Mission sharing no mutable state with the cached original."""
+    return Mission(
+        mission_id=mission.mission_id,
+        name=mission.name,
+        start=mission.start,
+        end=mission.end,
+        roles_required=dict(mission.roles_required),
+        status=mission.status,
+        assignments={role: list(pids) for role, pids in mission.assignments.items()},
+        continuous=mission.continuous,
+    )
+
+
 def load_missions(path: Path, templates: Optional[List[MissionTemplate]] = None) -> List[Mission]:
     """
     Load missions from CSV file.
-    
+
     If templates are provided, mission data is enriched from templates.
     """
-    if not path.exists():
+    # Cache key covers the template content used for enrichment, so enriched
+    # and raw loads don't mix and edited templates invalidate stale missions
+    extra_key = (
+        tuple(
+            (t.template_id, t.name, tuple(sorted(t.roles_required.items())), t.continuous)
+            for t in templates
+        )
+        if templates
+        else None
+    )
+    cached = _cache_get(path, extra_key)
+    if cached is not None:
+        # Missions are mutated in place by callers (assignments, carry-
+        # forward), so the cache keeps a pristine parse and every load hands
+        # out deep copies
+        return [_copy_mission(m) for m in cached]
+    # Single read attempt: one open syscall instead of an exists() stat + open
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         _create_empty_csv(path, ["id", "template_id", "start", "end", "assignments"])
         return []
-    
+
     # Build template lookup
     template_by_id: Dict[str, MissionTemplate] = {}
     if templates:
         for t in templates:
             template_by_id[t.template_id] = t
-    
+
+    # csv.reader with fixed column indexes over a single whole-file read:
+    # no per-row dict construction and no small buffered reads
     missions: List[Mission] = []
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        
-        for row in reader:
-            assignments = parse_assignments_json(row.get("assignments", "{}"))
-            template_id = row.get("template_id", "")
-            template = template_by_id.get(template_id) if template_id else None
-            
-            # Parse start/end timestamps
-            start_datetime = parse_datetime(row["start"])
-            end_datetime = parse_datetime(row["end"])
-            
-            if template:
-                # Use template for roles and other metadata
-                missions.append(Mission(
-                    mission_id=row["id"],
-                    name=f"{template.name} - {start_datetime.date()}",
-                    start=start_datetime,
-                    end=end_datetime,
-                    roles_required=template.roles_required.copy(),
-                    status="planned",
-                    assignments=assignments,
-                    continuous=template.continuous,
-                ))
-            else:
-                # No template - use defaults or legacy data
-                roles_required = parse_roles_json(row.get("roles_required", "{}")) if row.get("roles_required") else {}
-                continuous = row.get("continuous", "").lower() in ("true", "1", "yes")
-                missions.append(Mission(
-                    mission_id=row["id"],
-                    name=row.get("name", row["id"]),
-                    start=start_datetime,
-                    end=end_datetime,
-                    roles_required=roles_required,
-                    status=row.get("status", "planned"),
-                    assignments=assignments,
-                    continuous=continuous,
-                ))
-    return missions
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        _cache_put(path, missions, extra_key)
+        return []
+    idx = {name: i for i, name in enumerate(header)}
+    id_i, start_i, end_i = idx["id"], idx["start"], idx["end"]
+    tmpl_i = idx.get("template_id")
+    assign_i = idx.get("assignments")
+    name_i = idx.get("name")
+    roles_i = idx.get("roles_required")
+    status_i = idx.get("status")
+    cont_i = idx.get("continuous")
+
+    for row in reader:
+        if not row:
+            continue
+        assignments = parse_assignments_json(_cell(row, assign_i, "{}"))
+        template_id = _cell(row, tmpl_i)
+        template = template_by_id.get(template_id) if template_id else None
+
+        # Parse start/end timestamps
+        start_datetime = parse_datetime(row[start_i])
+        end_datetime = parse_datetime(row[end_i])
+
+        if template:
+            # Use template for roles and other metadata
+            missions.append(Mission(
+                mission_id=row[id_i],
+                name=f"{template.name} - {start_datetime.date()}",
+                start=start_datetime,
+                end=end_datetime,
+                roles_required=template.roles_required.copy(),
+                status="planned",
+                assignments=assignments,
+                continuous=template.continuous,
+            ))
+        else:
+            # No template - use defaults or legacy data
+            roles_raw = _cell(row, roles_i)
+            roles_required = parse_roles_json(roles_raw) if roles_raw else {}
+            continuous = _cell(row, cont_i) in _TRUE_STRINGS
+            missions.append(Mission(
+                mission_id=row[id_i],
+                name=_cell(row, name_i) or row[id_i],
+                start=start_datetime,
+                end=end_datetime,
+                roles_required=roles_required,
+                status=_cell(row, status_i, "planned") or "planned",
+                assignments=assignments,
+                continuous=continuous,
+            ))
+    _cache_put(path, missions, extra_key)
+    return [_copy_mission(m) for m in missions]
+
+
+def load_mission_ids(path: Path) -> Set[str]:
+    """
+    Load only the mission IDs from the missions CSV file.
+
+    Streams the id column with csv.reader instead of materializing full
+    Mission objects; use this when only duplicate detection is needed.
+    """
+    try:
+        f = path.open(newline="")
+    except FileNotFoundError:
+        return set()
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return set()
+        try:
+            id_idx = header.index("id")
+        except ValueError:
+            return set()
+        return {row[id_idx] for row in reader if row}
+
+
+def _mission_template_id(mission: Mission) -> str:
+    """Extract template_id from mission_id (e.g., "patrol1_morning_day1" -> "patrol1_morning")."""
+    parts = mission.mission_id.rsplit("_day", 1)
+    return parts[0] if len(parts) > 1 else mission.mission_id
 
 
 def save_missions(path: Path, missions: List[Mission]) -> None:
     """Save missions to CSV file with template reference and timestamps."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
+
     fieldnames = ["id", "template_id", "start", "end", "assignments"]
-    with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for mission in missions:
-            # Extract template_id from mission_id (e.g., "patrol1_morning_day1" -> "patrol1_morning")
-            parts = mission.mission_id.rsplit("_day", 1)
-            template_id = parts[0] if len(parts) > 1 else mission.mission_id
-            
-            writer.writerow({
-                "id": mission.mission_id,
-                "template_id": template_id,
-                "start": mission.start.isoformat(),
-                "end": mission.end.isoformat(),
-                "assignments": json.dumps(mission.assignments),
-            })
+    # Plain csv.writer with a large buffer: no per-row dict building, and the
+    # whole file is flushed in a few large writes instead of one per row.
+    with path.open("w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                mission.mission_id,
+                _mission_template_id(mission),
+                mission.start.isoformat(),
+                mission.end.isoformat(),
+                json.dumps(mission.assignments),
+            )
+            for mission in missions
+        )
+
+
+def append_missions(path: Path, new_missions: List[Mission]) -> None:
+    """Append missions to the CSV file without rewriting existing rows."""
+    _cache_invalidate(path)
+    if not path.exists():
+        _create_empty_csv(path, ["id", "template_id", "start", "end", "assignments"])
+    with path.open("a", newline="") as f:
+        writer = csv.writer(f)
+        for mission in new_missions:
+            writer.writerow([
+                mission.mission_id,
+                _mission_template_id(mission),
+                mission.start.isoformat(),
+                mission.end.isoformat(),
+                json.dumps(mission.assignments),
+            ])
 
 
 def get_mission_by_id(missions: List[Mission], mission_id: str) -> Optional[Mission]:
@@ -210,58 +422,96 @@ def get_mission_by_id(missions: List[Mission], mission_id: str) -> Optional[Miss
     return None
 
 
+def index_missions(missions: List[Mission]) -> Dict[str, Mission]:
+    """Build an id -> Mission dict for O(1) lookups instead of linear scans."""
+    return {m.mission_id: m for m in missions}
+
+
+def index_missions_by_date(missions: List[Mission]) -> Dict[dt.date, List[Mission]]:
+    """Bucket missions by start date, with each bucket pre-sorted by start."""
+    by_date: Dict[dt.date, List[Mission]] = {}
+    for m in missions:
+        by_date.setdefault(m.start.date(), []).append(m)
+    for bucket in by_date.values():
+        bucket.sort(key=lambda m: m.start)
+    return by_date
+
+
 # ============================================================================
 # Mission Templates (Metadata)
 # ============================================================================
 
 def load_mission_templates(path: Path) -> List[MissionTemplate]:
     """Load mission templates from CSV file."""
-    if not path.exists():
+    cached = _cache_get(path)
+    if cached is not None:
+        return list(cached)
+    # Single read attempt: one open syscall instead of an exists() stat + open
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         _create_empty_csv(path, ["id", "name", "start_time", "duration_hours", "roles_required", "continuous", "instances", "notes"])
         return []
-    
+
+    # csv.reader with fixed column indexes over a single whole-file read:
+    # no per-row dict construction and no small buffered reads
     templates: List[MissionTemplate] = []
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Parse start_time
-            time_str = row.get("start_time", "00:00")
-            start_time = dt.datetime.strptime(time_str, "%H:%M").time()
-            
-            continuous = row.get("continuous", "").lower() in ("true", "1", "yes")
-            instances = int(row.get("instances", 1) or 1)
-            
-            templates.append(MissionTemplate(
-                template_id=row["id"],
-                name=row["name"],
-                start_time=start_time,
-                duration_hours=float(row["duration_hours"]),
-                roles_required=parse_roles_json(row["roles_required"]),
-                continuous=continuous,
-                instances=instances,
-                notes=row.get("notes", ""),
-            ))
-    return templates
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        return []
+    idx = {name: i for i, name in enumerate(header)}
+    id_i, name_i = idx["id"], idx["name"]
+    dur_i, roles_i = idx["duration_hours"], idx["roles_required"]
+    time_i = idx.get("start_time")
+    cont_i = idx.get("continuous")
+    inst_i = idx.get("instances")
+    notes_i = idx.get("notes")
+    for row in reader:
+        if not row:
+            continue
+        # Parse start_time
+        time_str = _cell(row, time_i, "00:00")
+        start_time = dt.datetime.strptime(time_str, "%H:%M").time()
+
+        continuous = _cell(row, cont_i) in _TRUE_STRINGS
+        instances = int(_cell(row, inst_i, "1") or 1)
+
+        templates.append(MissionTemplate(
+            template_id=row[id_i],
+            name=row[name_i],
+            start_time=start_time,
+            duration_hours=float(row[dur_i]),
+            roles_required=parse_roles_json(row[roles_i]),
+            continuous=continuous,
+            instances=instances,
+            notes=_cell(row, notes_i),
+        ))
+    _cache_put(path, templates)
+    return list(templates)
 
 
 def save_mission_templates(path: Path, templates: List[MissionTemplate]) -> None:
     """Save mission templates to CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
     fieldnames = ["id", "name", "start_time", "duration_hours", "roles_required", "continuous", "instances", "notes"]
     with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for template in templates:
-            writer.writerow({
-                "id": template.template_id,
-                "name": template.name,
-                "start_time": template.start_time.strftime("%H:%M"),
-                "duration_hours": template.duration_hours,
-                "roles_required": json.dumps(template.roles_required),
-                "continuous": str(template.continuous),
-                "instances": template.instances,
-                "notes": template.notes,
-            })
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                template.template_id,
+                template.name,
+                template.start_time.strftime("%H:%M"),
+                template.duration_hours,
+                json.dumps(template.roles_required),
+                str(template.continuous),
+                template.instances,
+                template.notes,
+            )
+            for template in templates
+        )
 
 
 def get_missions_for_date(missions: List[Mission], date: dt.date) -> List[Mission]:
@@ -271,48 +521,103 @@ def get_missions_for_date(missions: List[Mission], date: dt.date) -> List[Missio
 
 def get_missions_for_person(missions: List[Mission], person_id: str) -> List[Mission]:
     """Get all missions where a person is assigned."""
-    result = []
-    for mission in missions:
-        if person_id in mission.all_assigned_people():
-            result.append(mission)
-    return result
+    return [m for m in missions if person_id in m.assigned_set()]
 
 
 # ============================================================================
 # Vacations
 # ============================================================================
 
-def load_vacations(path: Path) -> List[Vacation]:
-    """Load vacations from CSV file."""
-    if not path.exists():
+class VacationStore:
+    """
+    List of vacations plus set-backed lookup indexes, built in one pass.
+
+    Iterates like a plain List[Vacation] so existing callers keep working,
+    while is_on_vacation / get_vacations_for_person / build_vacation_index
+    get O(1) paths instead of re-scanning or re-indexing per command.
+    """
+
+    __slots__ = ("items", "_by_date", "_by_person", "_pair_set")
+
+    def __init__(self, items: List[Vacation]):
+        self.items = items
+        self._by_date: Dict[dt.date, Set[str]] = {}
+        self._by_person: Dict[str, List[Vacation]] = {}
+        self._pair_set: Set[Tuple[str, dt.date]] = set()
+        for v in items:
+            self._pair_set.add((v.person_id, v.date))
+            self._by_date.setdefault(v.date, set()).add(v.person_id)
+            self._by_person.setdefault(v.person_id, []).append(v)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def has(self, person_id: str, date: dt.date) -> bool:
+        """O(1) membership check for a (person, date) vacation pair."""
+        return (person_id, date) in self._pair_set
+
+    def on_date(self, date: dt.date) -> Set[str]:
+        """Person IDs on vacation on a date."""
+        return self._by_date.get(date, set())
+
+    def for_person(self, person_id: str) -> List[Vacation]:
+        """All vacations for a person."""
+        return self._by_person.get(person_id, [])
+
+
+def load_vacations(path: Path) -> VacationStore:
+    """Load vacations from CSV file into a VacationStore."""
+    cached = _cache_get(path)
+    if cached is not None:
+        # Vacation rows are immutable, but the store's list and indexes are
+        # not; rebuild a fresh store around the cached rows so caller
+        # mutations cannot poison later loads
+        return VacationStore(list(cached.items))
+    # Single read attempt: one open syscall instead of an exists() stat + open
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         _create_empty_csv(path, ["person_id", "date", "description"])
-        return []
-    
+        return VacationStore([])
+
+    # csv.reader with fixed column indexes over a single whole-file read:
+    # no per-row dict construction and no small buffered reads
     vacations: List[Vacation] = []
-    with path.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            vacations.append(Vacation(
-                person_id=row["person_id"],
-                date=dt.date.fromisoformat(row["date"]),
-                description=row.get("description", ""),
-            ))
-    return vacations
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, None)
+    if header is None:
+        return VacationStore([])
+    idx = {name: i for i, name in enumerate(header)}
+    pid_i, date_i = idx["person_id"], idx["date"]
+    desc_i = idx.get("description")
+    for row in reader:
+        if not row:
+            continue
+        vacations.append(Vacation(
+            person_id=row[pid_i],
+            date=dt.date.fromisoformat(row[date_i]),
+            description=_cell(row, desc_i),
+        ))
+    store = VacationStore(vacations)
+    _cache_put(path, store)
+    return VacationStore(list(vacations))
 
 
 def save_vacations(path: Path, vacations: List[Vacation]) -> None:
     """Save vacations to CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
     fieldnames = ["person_id", "date", "description"]
     with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for vacation in vacations:
-            writer.writerow({
-                "person_id": vacation.person_id,
-                "date": vacation.date.isoformat(),
-                "description": vacation.description,
-            })
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (vacation.person_id, vacation.date.isoformat(), vacation.description)
+            for vacation in vacations
+        )
 
 
 def add_vacation(vacations: List[Vacation], person_id: str, date: dt.date, description: str = "") -> List[Vacation]:
@@ -330,6 +635,8 @@ def remove_vacation(vacations: List[Vacation], person_id: str, date: dt.date) ->
 
 def get_vacations_for_person(vacations: List[Vacation], person_id: str) -> List[Vacation]:
     """Get all vacations for a person."""
+    if isinstance(vacations, VacationStore):
+        return list(vacations.for_person(person_id))
     return [v for v in vacations if v.person_id == person_id]
 
 
@@ -340,76 +647,264 @@ def get_vacations_for_date(vacations: List[Vacation], date: dt.date) -> List[Vac
 
 def is_on_vacation(vacations: List[Vacation], person_id: str, date: dt.date) -> bool:
     """Check if person is on vacation on a date."""
+    if isinstance(vacations, VacationStore):
+        return vacations.has(person_id, date)
     return any(v.person_id == person_id and v.date == date for v in vacations)
 
 
+def build_vacation_index(
+    vacations: List[Vacation],
+) -> Tuple[Dict[dt.date, Set[str]], Dict[str, List[Vacation]]]:
+    """
+    Build date -> person_ids and person_id -> vacations indexes in one pass.
+
+    Callers that query many (person, date) pairs should use these instead of
+    the linear helpers above.
+    """
+    if isinstance(vacations, VacationStore):
+        return vacations._by_date, vacations._by_person
+    by_date: Dict[dt.date, Set[str]] = {}
+    by_person: Dict[str, List[Vacation]] = {}
+    for v in vacations:
+        by_date.setdefault(v.date, set()).add(v.person_id)
+        by_person.setdefault(v.person_id, []).append(v)
+    return by_date, by_person
+
+
 # ============================================================================
 # Preferences
 # ============================================================================
 
-def load_preferences(path: Path) -> List[Preference]:
-    """Load preferences from CSV file."""
-    if not path.exists():
+# Preference types whose target is matched against a lowercased mission name
+_MISSION_NAME_PREF_TYPES = frozenset({"prefer_mission", "avoid_mission"})
+
+
+class PreferenceStore:
+    """
+    List of preferences plus by-person/by-type indexes, built in one pass.
+
+    Iterates like a plain List[Preference]; the getter/removal helpers take
+    O(1)/O(k) fast paths when handed a store instead of scanning the full
+    list per call.
+    """
+
+    __slots__ = ("items", "_by_person", "_by_type", "_packed")
+
+    def __init__(self, items: Iterable[Preference]):
+        # Accepts any iterable (e.g. the streaming row parser) and builds the
+        # flat list and both indexes in the same single pass
+        self.items: List[Preference] = []
+        self._by_person: Dict[str, List[Preference]] = {}
+        self._by_type: Dict[str, List[Preference]] = {}
+        self._packed: Optional[Dict[str, List[tuple]]] = None
+        append = self.items.append
+        for p in items:
+            append(p)
+            self._by_person.setdefault(p.person_id, []).append(p)
+            self._by_type.setdefault(p.type, []).append(p)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def for_person(self, person_id: str) -> List[Preference]:
+        """All preferences for a person."""
+        return self._by_person.get(person_id, [])
+
+    def by_type(self, pref_type: str) -> List[Preference]:
+        """All preferences of a type."""
+        return self._by_type.get(pref_type, [])
+
+    def add(self, pref: Preference) -> None:
+        """Append a preference, keeping the indexes in sync."""
+        self.items.append(pref)
+        self._by_person.setdefault(pref.person_id, []).append(pref)
+        self._by_type.setdefault(pref.type, []).append(pref)
+        self._packed = None
+
+    def packed_by_person(self) -> Dict[str, List[tuple]]:
+        """
+        Column-style (type, target, weight, expires) rows keyed by person.
+
+        Built lazily and cached; consumers like the scheduler's scoring loop
+        read plain tuple slots instead of dataclass attributes. Mission-name
+        targets are stored lowercased, matching how the scorer compares them.
+        """
+        if self._packed is None:
+            self._packed = {
+                pid: [
+                    (
+                        p.type,
+                        p.target.lower() if p.type in _MISSION_NAME_PREF_TYPES else p.target,
+                        p.priority_weight(),
+                        p.expires,
+                    )
+                    for p in prefs
+                ]
+                for pid, prefs in self._by_person.items()
+            }
+        return self._packed
+
+
+def load_preferences(path: Path) -> PreferenceStore:
+    """Load preferences from CSV file into a PreferenceStore."""
+    cached = _cache_get(path)
+    if cached is not None:
+        # Preference rows are immutable, but the store's list/indexes are
+        # not (add() mutates); rebuild a fresh store around the cached rows
+        # so caller mutations cannot poison later loads
+        return PreferenceStore(cached.items)
+    # Slurp the file in one read and tokenize from memory: avoids the many
+    # small buffered reads of line-at-a-time IO while keeping the csv
+    # module's quoting semantics. A failed open doubles as the missing-file
+    # check, saving the exists() stat.
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         _create_empty_csv(path, ["person_id", "type", "target", "priority", "expires"])
-        return []
-    
-    preferences: List[Preference] = []
-    with path.open() as f:
-        reader = csv.DictReader(f)
+        return PreferenceStore([])
+    store = PreferenceStore(_iter_preference_rows(csv.reader(io.StringIO(text, newline=""))))
+    _cache_put(path, store)
+    return PreferenceStore(store.items)
+
+
+def _iter_preference_rows(reader) -> Iterator[Preference]:
+    """Yield Preference objects from a csv reader, one row at a time."""
+    header = next(reader, None)
+    if header is None:
+        return
+    if header == ["person_id", "type", "target", "priority", "expires"]:
+        # Canonical header (what save_preferences writes): fixed positional
+        # unpacking; rows with trailing fields omitted fall back to defaults
         for row in reader:
-            expires = None
-            if row.get("expires"):
-                expires = dt.date.fromisoformat(row["expires"])
-            preferences.append(Preference(
-                person_id=row["person_id"],
-                type=row["type"],
-                target=row.get("target", ""),
-                priority=row.get("priority", "medium"),
-                expires=expires,
-            ))
-    return preferences
+            if len(row) == 5:
+                expires_raw = row[4]
+                yield Preference(
+                    row[0],
+                    row[1],
+                    row[2],
+                    row[3] or "medium",
+                    dt.date.fromisoformat(expires_raw) if expires_raw else None,
+                )
+            elif row:
+                yield Preference(
+                    row[0],
+                    row[1],
+                    row[2] if len(row) > 2 else "",
+                    (row[3] if len(row) > 3 else "") or "medium",
+                    None,
+                )
+    else:
+        idx = {name: i for i, name in enumerate(header)}
+        pid_i, type_i = idx["person_id"], idx["type"]
+        target_i = idx.get("target")
+        prio_i = idx.get("priority")
+        exp_i = idx.get("expires")
+        for row in reader:
+            if not row:
+                continue
+            expires_raw = _cell(row, exp_i)
+            yield Preference(
+                person_id=row[pid_i],
+                type=row[type_i],
+                target=_cell(row, target_i),
+                priority=_cell(row, prio_i, "medium") or "medium",
+                expires=dt.date.fromisoformat(expires_raw) if expires_raw else None,
+            )
+
+
+def iter_preferences(path: Path) -> Iterator[Preference]:
+    """
+    Stream preferences from CSV one row at a time.
+
+    For callers that only iterate once; reads incrementally and bypasses the
+    load cache, so memory stays bounded by a single row.
+    """
+    try:
+        f = path.open(newline="")
+    except FileNotFoundError:
+        return
+    with f:
+        yield from _iter_preference_rows(csv.reader(f))
 
 
 def save_preferences(path: Path, preferences: List[Preference]) -> None:
     """Save preferences to CSV file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_invalidate(path)
+    _ensure_parent_dir(path)
     fieldnames = ["person_id", "type", "target", "priority", "expires"]
-    with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for pref in preferences:
-            writer.writerow({
-                "person_id": pref.person_id,
-                "type": pref.type,
-                "target": pref.target,
-                "priority": pref.priority,
-                "expires": pref.expires.isoformat() if pref.expires else "",
-            })
+    # 1 MiB buffer: the whole file goes out in a few large writes
+    with path.open("w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                pref.person_id,
+                pref.type,
+                pref.target,
+                pref.priority,
+                pref.expires.isoformat() if pref.expires else "",
+            )
+            for pref in preferences
+        )
 
 
 def add_preference(preferences: List[Preference], pref: Preference) -> List[Preference]:
     """Add a preference. Allows multiple preferences per person."""
+    if isinstance(preferences, PreferenceStore):
+        preferences.add(pref)
+        return preferences
     preferences.append(pref)
     return preferences
 
 
 def remove_preference(preferences: List[Preference], person_id: str, pref_type: str, target: str = "") -> List[Preference]:
     """Remove preferences matching person_id, type, and optionally target."""
-    if target:
-        return [p for p in preferences if not (p.person_id == person_id and p.type == pref_type and p.target == target)]
-    return [p for p in preferences if not (p.person_id == person_id and p.type == pref_type)]
+    if isinstance(preferences, PreferenceStore):
+        # Check only the person's bucket; rebuild the flat list/indexes only
+        # when something actually matched
+        bucket = preferences.for_person(person_id)
+        doomed = {
+            id(p) for p in bucket
+            if p.type == pref_type and (not target or p.target == target)
+        }
+        if doomed:
+            return PreferenceStore(
+                [p for p in preferences.items if id(p) not in doomed]
+            )
+        return preferences
+    # Single fused pass; the target check collapses away when no target given
+    match_target = not target
+    return [
+        p for p in preferences
+        if not (p.person_id == person_id and p.type == pref_type
+                and (match_target or p.target == target))
+    ]
 
 
 def get_preferences_for_person(preferences: List[Preference], person_id: str, on_date: Optional[dt.date] = None) -> List[Preference]:
     """Get active preferences for a person, optionally filtered by date."""
-    result = [p for p in preferences if p.person_id == person_id]
-    if on_date:
-        result = [p for p in result if p.is_active(on_date)]
-    return result
+    if isinstance(preferences, PreferenceStore):
+        result = preferences.for_person(person_id)
+        if on_date:
+            # Inline is_active: one attribute compare per preference instead
+            # of a method call
+            return [p for p in result if p.expires is None or on_date <= p.expires]
+        return list(result)
+    # One pass, one output list; no intermediate person-filtered list
+    return [
+        p for p in preferences
+        if p.person_id == person_id
+        and (on_date is None or p.expires is None or on_date <= p.expires)
+    ]
 
 
 def get_preferences_by_type(preferences: List[Preference], pref_type: str) -> List[Preference]:
     """Get all preferences of a specific type."""
+    if isinstance(preferences, PreferenceStore):
+        return list(preferences.by_type(pref_type))
     return [p for p in preferences if p.type == pref_type]
 
 
@@ -419,7 +914,7 @@ def get_preferences_by_type(preferences: List[Preference], pref_type: str) -> Li
 
 def _create_empty_csv(path: Path, fieldnames: List[str]) -> None:
     """Create an empty CSV file with headers."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(path)
     with path.open("w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import json
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Dict, List, Optional
 
+try:  # optional: 2-5x faster JSON decoding for the JSON-in-CSV columns
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class Person:
     person_id: str
     name: str
@@ -14,13 +22,19 @@ class Person:
     role: str  # primary role
     unit: str
     secondary_roles: List[str] = field(default_factory=list)
+    # All fillable roles as one frozenset; built once at construction so
+    # can_fill_role is a single hash probe in the scheduler's hot loop
+    _roles: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._roles = frozenset((self.role, *self.secondary_roles))
 
     def can_fill_role(self, role: str) -> bool:
         """Check if person can fill a role (primary or secondary)."""
-        return self.role == role or role in self.secondary_roles
+        return role in self._roles
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vacation:
     """A scheduled vacation day for a person."""
     person_id: str
@@ -28,7 +42,12 @@ class Vacation:
     description: str = ""
 
 
-@dataclass
+# Priority -> numeric weight; shared across all Preference instances so
+# priority_weight() does not rebuild a dict per call
+_PRIORITY_WEIGHTS = {"low": 0.5, "medium": 1.0, "high": 2.0}
+
+
+@dataclass(slots=True, frozen=True)
 class Preference:
     """A preference for a person that affects scheduling."""
     person_id: str
@@ -45,11 +64,10 @@ class Preference:
 
     def priority_weight(self) -> float:
         """Return numeric weight for priority."""
-        weights = {"low": 0.5, "medium": 1.0, "high": 2.0}
-        return weights.get(self.priority, 1.0)
+        return _PRIORITY_WEIGHTS.get(self.priority, 1.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Mission:
     """A mission with role requirements and assignments."""
     mission_id: str
@@ -60,10 +78,34 @@ class Mission:
     status: str = "planned"  # planned, started, completed
     assignments: Dict[str, List[str]] = field(default_factory=dict)  # e.g., {"commander": ["john"], "soldier": ["mike", "sarah"]}
     continuous: bool = False  # If true, assignments carry over to next day automatically
+    # Cached flattened assignment set; invalidated by assign/unassign
+    _assigned_cache: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    # (start, end, hours) memo so scoring does not redo timedelta math;
+    # keyed on the endpoints so edits invalidate it naturally
+    _duration_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Lazy person -> roles reverse index so unassign does not scan every role
+    _roles_by_person: Optional[Dict[str, List[str]]] = field(default=None, init=False, repr=False, compare=False)
+    # (name, lowered) memo so per-candidate preference matching does not
+    # re-lower the name; keyed on the name so renames invalidate it
+    _name_lower_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def name_lower(self) -> str:
+        """Return the mission name lowercased (cached)."""
+        cached = self._name_lower_cache
+        if cached is not None and cached[0] == self.name:
+            return cached[1]
+        lowered = self.name.lower()
+        self._name_lower_cache = (self.name, lowered)
+        return lowered
 
     def duration_hours(self) -> float:
         """Return mission duration in hours."""
-        return (self.end - self.start).total_seconds() / 3600
+        cached = self._duration_cache
+        if cached is not None and cached[0] == self.start and cached[1] == self.end:
+            return cached[2]
+        hours = (self.end - self.start).total_seconds() / 3600
+        self._duration_cache = (self.start, self.end, hours)
+        return hours
 
     def is_filled(self) -> bool:
         """Check if all role requirements are met."""
@@ -85,10 +127,31 @@ class Mission:
 
     def all_assigned_people(self) -> List[str]:
         """Return list of all person IDs assigned to this mission."""
-        people = []
-        for person_list in self.assignments.values():
-            people.extend(person_list)
-        return people
+        return list(chain.from_iterable(self.assignments.values()))
+
+    def assigned_set(self) -> frozenset:
+        """
+        Flattened set of all assigned person IDs.
+
+        Cached on first access; assign_person/unassign_person invalidate it.
+        Callers that mutate the assignments dict directly should keep using
+        all_assigned_people().
+        """
+        if self._assigned_cache is None:
+            self._assigned_cache = frozenset(
+                pid for pids in self.assignments.values() for pid in pids
+            )
+        return self._assigned_cache
+
+    def _person_roles(self) -> Dict[str, List[str]]:
+        """Reverse person -> roles index, built lazily from assignments."""
+        if self._roles_by_person is None:
+            index: Dict[str, List[str]] = {}
+            for role, person_ids in self.assignments.items():
+                for pid in person_ids:
+                    index.setdefault(pid, []).append(role)
+            self._roles_by_person = index
+        return self._roles_by_person
 
     def assign_person(self, role: str, person_id: str) -> None:
         """Assign a person to a role in this mission."""
@@ -96,15 +159,20 @@ class Mission:
             self.assignments[role] = []
         if person_id not in self.assignments[role]:
             self.assignments[role].append(person_id)
+            self._assigned_cache = None
+            if self._roles_by_person is not None:
+                self._roles_by_person.setdefault(person_id, []).append(role)
 
     def unassign_person(self, person_id: str) -> None:
         """Remove a person from all roles in this mission."""
-        for role in self.assignments:
-            if person_id in self.assignments[role]:
+        roles = self._person_roles().pop(person_id, None)
+        if roles:
+            for role in roles:
                 self.assignments[role].remove(person_id)
+            self._assigned_cache = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MissionTemplate:
     """Template/metadata for a mission type."""
     template_id: str
@@ -117,7 +185,7 @@ class MissionTemplate:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Campaign:
     """Campaign metadata."""
     name: str
@@ -129,33 +197,49 @@ class Campaign:
 
 # Utility functions
 
+@functools.lru_cache(maxsize=8192)
 def parse_datetime(value: str) -> dt.datetime:
-    """Parse ISO datetime string."""
+    """Parse ISO datetime string (memoized; the same timestamps repeat across rows)."""
     return dt.datetime.fromisoformat(value)
 
 
+@functools.lru_cache(maxsize=8192)
 def parse_date(value: str) -> dt.date:
-    """Parse ISO date string."""
+    """Parse ISO date string (memoized; the same dates repeat across rows)."""
     return dt.date.fromisoformat(value)
 
 
 def parse_json_dict(value: str) -> Dict:
     """Parse JSON string to dict."""
-    if not value or value.strip() == "":
+    if not value or value == "{}" or value.strip() == "":
         return {}
     try:
-        return json.loads(value)
-    except json.JSONDecodeError as exc:
+        return _json_loads(value)
+    except ValueError as exc:  # json.JSONDecodeError and orjson.JSONDecodeError
         raise ValueError(f"Invalid JSON: {value}") from exc
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_json_dict_cached(value: str) -> Dict:
+    """Cached json.loads for strings that repeat across rows (e.g. roles).
+
+    Callers must not mutate the returned dict; the role/assignment parsers
+    below rebuild fresh containers from it.
+    """
+    return parse_json_dict(value)
+
+
 def parse_roles_json(value: str) -> Dict[str, int]:
     """Parse roles JSON to dict with int values."""
-    parsed = parse_json_dict(value)
+    if not value or value == "{}":
+        return {}
+    parsed = _parse_json_dict_cached(value)
     return {role: int(count) for role, count in parsed.items()}
 
 
 def parse_assignments_json(value: str) -> Dict[str, List[str]]:
     """Parse assignments JSON to dict with list values."""
-    parsed = parse_json_dict(value)
+    if not value or value == "{}":
+        return {}
+    parsed = _parse_json_dict_cached(value)
     return {role: list(people) for role, people in parsed.items()}
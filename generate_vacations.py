@@ -1,9 +1,11 @@
 import csv
 import json
+import math
 import random
 import argparse
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional, Any, Union
+from typing import List, Dict, Iterator, Set, Optional, Any, Union
 from dataclasses import dataclass, field
 import sys
 import os
@@ -11,12 +13,12 @@ import concurrent.futures
 
 # --- Data Structures ---
 
-@dataclass
+@dataclass(slots=True)
 class ShiftRequirement:
     role: str
     count: Union[int, List[int]]
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     id: str
     name: str
@@ -25,7 +27,7 @@ class Person:
     unavailable_dates: List[str] = field(default_factory=list)
     preferences: List[Dict[str, str]] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class CampaignConfig:
     name: str
     start_date: datetime
@@ -35,8 +37,11 @@ class CampaignConfig:
     retries: int
     boost: int = 0
     boost_dates: List[str] = field(default_factory=list)
+    # Requirements minus external_* roles, tagged once at load time so the
+    # campaign loop does not re-filter per run
+    internal_requirements: List[ShiftRequirement] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Shift:
     id: str
     date: str
@@ -45,12 +50,12 @@ class Shift:
 
 # --- CSV Parsing & Data Loading ---
 
-def parse_csv(file_path: str) -> List[Dict[str, str]]:
+def parse_csv(file_path: str) -> Iterator[Dict[str, str]]:
     with open(file_path, 'r', encoding='utf-8') as f:
-        # Filter out comments
-        lines = [line for line in f if not line.strip().startswith('#')]
-        reader = csv.DictReader(lines)
-        return list(reader)
+        # Filter out comments; stream rows instead of materializing the
+        # filtered lines and the parsed rows as two full lists
+        reader = csv.DictReader(line for line in f if not line.strip().startswith('#'))
+        yield from reader
 
 def load_people(file_path: str) -> List[Person]:
     raw_rows = parse_csv(file_path)
@@ -82,18 +87,26 @@ def load_people(file_path: str) -> List[Person]:
         is_unit_123 = unit in ['1', '2', '3']
 
         # Logic Ported from csvParser.ts: csvToPeople
-        
+
+        # Lowercase each role once; the classification below is all set
+        # membership instead of repeated any(r.lower() ...) scans
+        roles_lower = {r.lower() for r in roles}
+
         # 1. Expand Samal
-        if any(r.lower() == 'samal' for r in roles):
-            if not any(r.lower() == 'officer' for r in roles): roles.append('officer')
-            if not any(r.lower() == 'commander' for r in roles): roles.append('commander')
-        
+        if 'samal' in roles_lower:
+            if 'officer' not in roles_lower:
+                roles.append('officer')
+                roles_lower.add('officer')
+            if 'commander' not in roles_lower:
+                roles.append('commander')
+                roles_lower.add('commander')
+
         # 2. Identify Types
-        is_staff_role = any(r.lower() in ['commander', 'officer', 'samal'] for r in roles)
-        
+        is_staff_role = not roles_lower.isdisjoint({'commander', 'officer', 'samal'})
+
         # soldier_extra criteria: (soldier/medic/driver) AND !Staff AND Unit 1/2/3
         is_soldier_type = (
-            any(r.lower() in ['soldier', 'medic', 'driver'] for r in roles)
+            not roles_lower.isdisjoint({'soldier', 'medic', 'driver'})
             and not is_staff_role
             and is_unit_123
         )
@@ -103,17 +116,17 @@ def load_people(file_path: str) -> List[Person]:
             if 'staff_extra' not in roles: roles.append('staff_extra')
             if 'total_command' not in roles: roles.append('total_command')
             # ONLY primary commanders in field units can also do soldier duties
-            is_primary_commander = any(r.lower() == 'commander' for r in roles)
+            is_primary_commander = 'commander' in roles_lower
             if is_primary_commander and is_unit_123:
                 if 'soldier' not in roles: roles.append('soldier')
                 if 'total_soldiers' not in roles: roles.append('total_soldiers')
                 if 'soldier_extra' not in roles: roles.append('soldier_extra')
-            
+
         if is_soldier_type:
             if 'soldier_extra' not in roles: roles.append('soldier_extra')
             if 'total_soldiers' not in roles: roles.append('total_soldiers')
             # Implicit soldier role for medic/drivers in field units
-            if not any(r.lower() == 'soldier' for r in roles):
+            if 'soldier' not in roles_lower:
                 roles.append('soldier')
 
         # 4. Final Cleanup: Remove fighter roles from non-field units
@@ -153,7 +166,7 @@ def load_preferences(file_path: str, people: List[Person]):
                 })
 
 def load_campaigns(file_path: str) -> List[CampaignConfig]:
-    rows = parse_csv(file_path)
+    rows = list(parse_csv(file_path))
     if not rows:
         raise ValueError("Campaign CSV is empty")
     
@@ -215,13 +228,91 @@ def load_campaigns(file_path: str) -> List[CampaignConfig]:
             alat_end_date=alat_end_date,
             retries=retries,
             boost=boost,
-            boost_dates=boost_dates
+            boost_dates=boost_dates,
+            internal_requirements=[
+                req for req in requirements if not req.role.startswith('external_')
+            ]
         ))
 
     return campaigns
 
 # --- Scheduler Algorithm ---
 
+def _req_priority(role: str) -> int:
+    if role == 'total_command': return -10
+    if role == 'commander': return -5
+    if role == 'total_soldiers': return 10
+    return 0
+
+
+def _build_daily_reqs(people, requirements, days, boost, boost_dates):
+    """Pre-sorted per-day requirement rows, identical for every attempt.
+
+    Each row carries role/total/remaining/rarity/priority; attempts take
+    shallow copies so 'remaining' can be consumed without rebuilding (or
+    re-sorting) the rows day by day, attempt by attempt.
+    """
+    roles_by_person = [set(p.roles) for p in people]
+    qualified_count = {
+        req.role: sum(1 for roles in roles_by_person if req.role in roles)
+        for req in requirements
+    }
+
+    template = []
+    for day in days:
+        day_str = day.strftime("%Y-%m-%d")
+        rows = []
+        for req in requirements:
+            # Determine count for this specific day
+            needed = 0
+            if isinstance(req.count, int):
+                needed = req.count
+            elif isinstance(req.count, list):
+                # day.weekday(): Mon=0, Sun=6
+                idx = day.weekday()
+                if 0 <= idx < len(req.count):
+                    needed = req.count[idx]
+                else:
+                    needed = req.count[0] # Fallback
+
+            if req.role == 'total_soldiers' and boost > 0 and day_str in boost_dates:
+                needed += boost
+
+            rows.append({
+                'role': req.role,
+                'total': needed,
+                'remaining': needed,
+                'rarity': qualified_count[req.role],
+                'priority': _req_priority(req.role)
+            })
+
+        # Sort by priority THEN rarity
+        rows.sort(key=lambda x: (x['priority'], x['rarity']))
+        template.append(rows)
+    return template
+
+
+def _attempt_worker(task):
+    """Run one seeded attempt in a pool worker; failures count as unsuccessful.
+
+    Only a (success, spread, seed) triple travels back to the parent — the
+    winning shift list is rebuilt there from its seed, so thousands of Shift
+    objects are never pickled across the process boundary.
+    """
+    args, daily_reqs_template, field_ids, seed = task
+    random.seed(seed)
+    try:
+        shifts, success = attempt_generate(*args, daily_reqs_template=daily_reqs_template)
+    except Exception:
+        return False, 0, seed
+    if not success or not field_ids:
+        return success, 0, seed
+    # One pass over shifts instead of a scan per person
+    c = Counter(s.person_id for s in shifts)
+    counts = [c.get(pid, 0) for pid in field_ids]
+    return True, max(counts) - min(counts), seed
+
+
 def generate_schedule(
     people: List[Person],
     requirements: List[ShiftRequirement],
@@ -230,11 +321,18 @@ def generate_schedule(
     alat_end_date: Optional[datetime],
     boost: int = 0,
     boost_dates: List[str] = [],
-    max_tries: int = 100
+    max_tries: int = 100,
+    executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
 ) -> List[Shift]:
-    
+    """Run max_tries randomized attempts and return the fairest schedule.
+
+    Attempts are independent, so beyond a handful they run as seeded tasks
+    on a ProcessPoolExecutor (the caller may pass a pool to reuse across
+    campaigns); the winner is rebuilt from its seed. Returns [] when no
+    attempt produced a valid schedule.
+    """
     # print(f"Simulating {max_tries} randomized schedules...")
-    
+
     successful_attempts = []
     
     days_list = []
@@ -243,38 +341,77 @@ def generate_schedule(
         days_list.append(curr)
         curr += timedelta(days=1)
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
+    # Field people never change between attempts; compute once, not per future
+    field_ids = frozenset(p.id for p in people if p.unit in ['1', '2', '3'])
+
+    args = (people, requirements, days_list, alat_end_date, boost, boost_dates)
+    # People and requirements never change between attempts, so the per-day
+    # requirement rows are built once for the whole campaign
+    daily_reqs_template = _build_daily_reqs(people, requirements, days_list, boost, boost_dates)
+
+    if max_tries <= 4:
+        # Process startup would dominate such a small run; stay in-process
+        for _ in range(max_tries):
+            shifts, success = attempt_generate(*args, daily_reqs_template=daily_reqs_template)
+            if not success:
+                continue
+            if field_ids:
+                # One pass over shifts instead of a scan per person
+                c = Counter(s.person_id for s in shifts)
+                counts = [c.get(pid, 0) for pid in field_ids]
+                spread = max(counts) - min(counts)
+            else:
+                spread = 0
+            successful_attempts.append({'shifts': shifts, 'spread': spread})
+
+        if successful_attempts:
+            # Only the minimum is needed; no point sorting the whole list
+            best = min(successful_attempts, key=lambda x: x['spread'])
+            return best['shifts']
+        # print("Critical: No valid schedule found.")
+        return []
+
+    # Cap the pool: no more workers than cores, tries, or a sane upper
+    # bound (the no-arg default can spawn 61 workers on big machines)
+    workers = min(os.cpu_count() or 4, max_tries, 16)
+    seeds = [random.randrange(2 ** 32) for _ in range(max_tries)]
+    # A caller-provided pool is reused across campaigns; only spin up
+    # (and tear down) a private one when running standalone
+    own_pool = executor is None
+    if own_pool:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        # Individual futures (rather than a chunked map) so attempts still
+        # queued can be cancelled once the incumbent cannot be beaten
         futures = [
-            executor.submit(attempt_generate, people, requirements, days_list, alat_end_date, boost, boost_dates) 
-            for _ in range(max_tries)
+            executor.submit(_attempt_worker, (args, daily_reqs_template, field_ids, seed))
+            for seed in seeds
         ]
-        
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                shifts, success = future.result()
-                if success:
-                    field_people = [p for p in people if p.unit in ['1', '2', '3']]
-                    if field_people:
-                        counts = []
-                        for p in field_people:
-                            c = len([s for s in shifts if s.person_id == p.id])
-                            counts.append(c)
-                        spread = max(counts) - min(counts)
-                        successful_attempts.append({'shifts': shifts, 'spread': spread})
-                    else:
-                        successful_attempts.append({'shifts': shifts, 'spread': 0})
-            except Exception as e:
-                # print(f"Simulation failed with error: {e}")
-                pass
-    
-    if successful_attempts:
-        successful_attempts.sort(key=lambda x: x['spread'])
-        best = successful_attempts[0]
-        # print(f"Found {len(successful_attempts)} valid schedules. Picking best (Spread: {best['spread']})")
-        return best['shifts']
-    
-    # print("Critical: No valid schedule found.")
-    return []
+        best_seed = None
+        best_spread = math.inf
+        for fut in concurrent.futures.as_completed(futures):
+            success, spread, seed = fut.result()
+            if success and spread < best_spread:
+                best_spread = spread
+                best_seed = seed
+                if best_spread == 0:
+                    # A spread of zero cannot be improved on; drop the
+                    # remaining queued attempts instead of running them
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    finally:
+        if own_pool:
+            executor.shutdown()
+
+    if best_seed is None:
+        # print("Critical: No valid schedule found.")
+        return []
+
+    # Rebuild the winning schedule deterministically from its seed
+    random.seed(best_seed)
+    shifts, _success = attempt_generate(*args, daily_reqs_template=daily_reqs_template)
+    return shifts
 
 def attempt_generate(
     people: List[Person],
@@ -283,25 +420,81 @@ def attempt_generate(
     alat_end_date: Optional[datetime],
     boost: int = 0,
     boost_dates: List[str] = [],
-    debug: bool = False
+    debug: bool = False,
+    daily_reqs_template: Optional[List[List[Dict[str, Any]]]] = None
 ) -> tuple[List[Shift], bool]:
-    
+
+    # generate_schedule passes the prebuilt per-day requirement rows so the
+    # 100-odd attempts of a campaign share one precompute; direct callers
+    # get them built here
+    if daily_reqs_template is None:
+        daily_reqs_template = _build_daily_reqs(people, requirements, days, boost, boost_dates)
+
     shifts = []
-    
+
+    # Maintained on every append so the last-day copy and the post-ALAT
+    # rotation penalty never rescan (or re-parse dates of) the full shift list
+    shifts_by_date: Dict[str, List[Shift]] = {}
+    post_alat_shifts: Dict[str, int] = {p.id: 0 for p in people}
+    # (day, role) -> shifts created, so the final validation pass compares
+    # counters instead of rescanning the shift list per day and role
+    day_role_filled: Dict[tuple, int] = {}
+
     shift_counts = {p.id: 0 for p in people}
-    last_shift_date = {p.id: None for p in people} 
+    last_shift_date = {p.id: None for p in people}
     work_streaks = {p.id: 0 for p in people}
     role_counts = {p.id: {} for p in people}
 
-    for day in days:
-        day_str = day.strftime("%Y-%m-%d")
+    # Hash-set views of per-person roles/unavailability, built once per
+    # attempt instead of rescanned per day
+    roles_set = {p.id: frozenset(p.roles) for p in people}
+    unavailable_set = {p.id: frozenset(p.unavailable_dates) for p in people}
+
+    # Collapse each person's weekend/weekday preferences into two precomputed
+    # score deltas so the scoring pass does one dict lookup instead of
+    # re-scanning the preference list per pick
+    pref_weekend_delta = {}
+    pref_weekday_delta = {}
+    for p in people:
+        weekend_delta = weekday_delta = 0
+        for pref in p.preferences:
+            if pref['type'] == 'prefer_weekend':
+                weekend_delta += 40000000  # Penalty for working
+                weekday_delta -= 1000000   # Bonus for weekdays
+            elif pref['type'] == 'prefer_weekday':
+                weekend_delta -= 40000000  # Bonus for working
+                weekday_delta += 1000000   # Penalty for weekdays
+        pref_weekend_delta[p.id] = weekend_delta
+        pref_weekday_delta[p.id] = weekday_delta
+
+    # All day strings formatted once up front; the loop below (and every
+    # attempt retry) then never calls strftime for in-range days
+    date_strs = [d.strftime("%Y-%m-%d") for d in days]
+    last_day_idx = len(days) - 1
+
+    # Unavailability inverted to day indexes in one pass over the (sparse)
+    # unavailable dates, so the per-day availability filter does not probe
+    # every person's date set; days with nobody away reuse the people list
+    date_to_idx = {d_str: i for i, d_str in enumerate(date_strs)}
+    unavail_ids_by_day: List[Set[str]] = [set() for _ in date_strs]
+    for p in people:
+        for d in unavailable_set[p.id]:
+            i = date_to_idx.get(d)
+            if i is not None:
+                unavail_ids_by_day[i].add(p.id)
+
+    for day_idx, day in enumerate(days):
+        day_str = date_strs[day_idx]
         yesterday = day - timedelta(days=1)
-        tomorrow = day + timedelta(days=1)
-        tomorrow_str = tomorrow.strftime("%Y-%m-%d")
+        if day_idx < last_day_idx:
+            tomorrow_str = date_strs[day_idx + 1]
+        else:
+            tomorrow_str = (day + timedelta(days=1)).strftime("%Y-%m-%d")
         is_weekend = (day.weekday() in [4, 5]) # Fri or Sat
         is_saturday = (day.weekday() == 5)
         
-        available = [p for p in people if day_str not in p.unavailable_dates]
+        off_today = unavail_ids_by_day[day_idx]
+        available = [p for p in people if p.id not in off_today] if off_today else people
         
         # Check ALAT Period (or last 2 days)
         is_alat = False
@@ -338,7 +531,10 @@ def attempt_generate(
                     person_id=person.id
                 )
                 shifts.append(s)
-                
+                shifts_by_date.setdefault(day_str, []).append(s)
+                key = (day_str, r_name)
+                day_role_filled[key] = day_role_filled.get(key, 0) + 1
+
                 shift_counts[person.id] += 1
                 last_shift_date[person.id] = day
                 work_streaks[person.id] += 1
@@ -356,9 +552,10 @@ def attempt_generate(
         
         # Check last day of campaign: Copy shifts from yesterday
         # This creates a 2-day block (yesterday + today matched)
-        if day == days[-1]:
-            yesterday_shifts = [s for s in shifts if s.date == yesterday.strftime("%Y-%m-%d")]
-            for prev_s in yesterday_shifts:
+        if day_idx == last_day_idx:
+            yesterday_str = date_strs[day_idx - 1] if day_idx > 0 else yesterday.strftime("%Y-%m-%d")
+            yesterday_shifts = shifts_by_date.get(yesterday_str, ())
+            for prev_s in list(yesterday_shifts):
                 s = Shift(
                     id=f"{day_str}-{prev_s.role}-copy-{prev_s.person_id}",
                     date=day_str,
@@ -366,7 +563,12 @@ def attempt_generate(
                     person_id=prev_s.person_id
                 )
                 shifts.append(s)
-                
+                shifts_by_date.setdefault(day_str, []).append(s)
+                key = (day_str, prev_s.role)
+                day_role_filled[key] = day_role_filled.get(key, 0) + 1
+                if alat_end_date and day > alat_end_date:
+                    post_alat_shifts[prev_s.person_id] += 1
+
                 # Update state
                 shift_counts[prev_s.person_id] += 1
                 last_shift_date[prev_s.person_id] = day
@@ -377,43 +579,11 @@ def attempt_generate(
             continue
         
         # --- Normal Generation Logic ---
-        
-        def get_req_priority(r):
-            if r == 'total_command': return -10
-            if r == 'commander': return -5
-            if r == 'total_soldiers': return 10
-            return 0
 
-        daily_reqs = []
-        for req in requirements:
-            qualified_count = len([p for p in people if req.role in p.roles])
-            
-            # Determine count for this specific day
-            needed = 0
-            if isinstance(req.count, int):
-                needed = req.count
-            elif isinstance(req.count, list):
-                # day.weekday(): Mon=0, Sun=6
-                idx = day.weekday()
-                if 0 <= idx < len(req.count):
-                    needed = req.count[idx]
-                else:
-                    needed = req.count[0] # Fallback
-            
-            if req.role == 'total_soldiers' and boost > 0 and day_str in boost_dates:
-                needed += boost
+        # Fresh mutable copies of the pre-sorted requirement rows; only
+        # 'remaining' is consumed during assignment
+        daily_reqs = [dict(row) for row in daily_reqs_template[day_idx]]
 
-            daily_reqs.append({
-                'role': req.role,
-                'total': needed,
-                'remaining': needed,
-                'rarity': qualified_count,
-                'priority': get_req_priority(req.role)
-            })
-        
-        # Sort by priority THEN rarity
-        daily_reqs.sort(key=lambda x: (x['priority'], x['rarity']))
-        
         total_needed = sum(r['remaining'] for r in daily_reqs)
         
         for p in people:
@@ -421,105 +591,121 @@ def attempt_generate(
             if not last or (last.date() if isinstance(last, datetime) else last) != yesterday.date():
                 work_streaks[p.id] = 0
 
+        is_penultimate_day = day_idx == last_day_idx - 1
+        jitter = random.random  # avoid the attribute lookup per candidate
+
         while total_needed > 0:
-            best_choice = None 
-            
+            # Score components that do not depend on the role are computed
+            # once per candidate per pick, so the inner loop over
+            # (role, person) pairs only adds the role-specific terms
+            candidates = []
+            for person in available:
+                if person.id in assigned_today:
+                    continue
+
+                current_total = shift_counts[person.id]
+                streak = work_streaks[person.id]
+                last_date = last_shift_date[person.id]
+                worked_yesterday = False
+                days_since = 999
+
+                if last_date:
+                    diff = day - last_date
+                    days_since = diff.days
+                    if days_since == 1:
+                        worked_yesterday = True
+
+                # Sandwich Constraint: Don't schedule for 1 day if they were just on vacation and have vacation tomorrow
+                if not worked_yesterday and tomorrow_str in unavailable_set[person.id]:
+                    continue
+
+                # 1. Balanced workload penalty
+                # Using POWER 2 instead of 8 to allow preferences and streaks to have influence
+                projected_total = current_total
+                if is_penultimate_day:
+                     projected_total += 1
+                base = (projected_total ** 2) * 1000000
+
+                # 2. Jitter
+                base += jitter() * 1000
+
+                # 3. Preferences (prefer_weekend, prefer_weekday)
+                # Increased to 40M to be comparable/stronger than a 1-shift workload difference
+                if is_weekend:
+                    base += pref_weekend_delta[person.id]
+                else:
+                    base += pref_weekday_delta[person.id]
+
+                if is_saturday:
+                    if worked_yesterday:
+                        base -= 10000000
+                    else:
+                        base += 10000000
+
+                if not worked_yesterday:
+                    if days_since < 3: base += 1000000
+                    if days_since == 2: base += 50000000 # STRONG GAP PENALTY (Avoid 1-0-1)
+                    if days_since < 2: base += 1000000
+
+                # Streak Bonus: Encourage 2-3 day blocks
+                if not is_weekend and streak > 0 and streak < 3:
+                    base -= 25000000
+
+                # 4. Post-ALAT Rotation Penalty
+                # Ensure everyone goes home at least once in the week following ALAT.
+                # We penalize picking someone who hasn't had a day off yet in this week.
+                if is_post_alat_week:
+                    # Count days off since alat_end_date
+                    days_since_alat = (day - alat_end_date).days # 1 to 7
+                    # How many shifts in this period: shifts are appended
+                    # day by day and a person works at most once per day,
+                    # so the running counter is exactly the count of their
+                    # shifts strictly between alat_end_date and today
+                    period_shifts = post_alat_shifts[person.id]
+                    if period_shifts == days_since_alat - 1 and days_since_alat > 1:
+                        # They have worked every day so far! Give penalty.
+                        # Increasing penalty as we get closer to day 7.
+                        base += days_since_alat * 3000000
+
+                is_staff_unit = (person.unit or '').lower() == 'staff'
+                unit_clash = (
+                    not is_staff_unit and person.unit
+                    and person.unit in assigned_units_today
+                )
+
+                # Carry the person's role-count dict so the inner loop does
+                # a single hash probe instead of role_counts[id].get(role)
+                candidates.append((person, base, unit_clash, role_counts[person.id]))
+
+            best_choice = None
+            best_score = math.inf
+
             for req in daily_reqs:
                 if req['remaining'] <= 0:
                     continue
-                
-                for person in available:
-                    if person.id in assigned_today:
-                        continue
-                    
-                    if req['role'] not in person.roles:
-                        continue
-                    
-                    current_total = shift_counts[person.id]
-                    streak = work_streaks[person.id]
-                    last_date = last_shift_date[person.id]
-                    worked_yesterday = False
-                    days_since = 999
-                    
-                    if last_date:
-                        diff = day - last_date
-                        days_since = diff.days
-                        if days_since == 1:
-                            worked_yesterday = True
-                    
-                    # Sandwich Constraint: Don't schedule for 1 day if they were just on vacation and have vacation tomorrow
-                    if not worked_yesterday and tomorrow_str in person.unavailable_dates:
+
+                role = req['role']
+                # Roles Priority Score (mirroring scheduler.ts)
+                role_priority_score = req['priority'] * 20000000
+                is_specialist = role.lower() in ['medic', 'driver']
+
+                for person, base, unit_clash, person_role_counts in candidates:
+                    if role not in roles_set[person.id]:
                         continue
-                    
-                    # 1. Balanced workload penalty
-                    # Using POWER 2 instead of 8 to allow preferences and streaks to have influence
-                    projected_total = current_total
-                    if len(days) >= 2 and day == days[-2]:
-                         projected_total += 1
-                    score = (projected_total ** 2) * 1000000
-                    
-                    # 2. Jitter
-                    score += random.random() * 1000
-
-                    # 3. Preferences (prefer_weekend, prefer_weekday)
-                    # Increased to 40M to be comparable/stronger than a 1-shift workload difference
-                    for pref in person.preferences:
-                        if pref['type'] == 'prefer_weekend':
-                            if is_weekend:
-                                score += 40000000  # Penalty for working
-                            else:
-                                score -= 1000000   # Bonus for weekdays
-                        elif pref['type'] == 'prefer_weekday':
-                            if is_weekend:
-                                score -= 40000000  # Bonus for working
-                            else:
-                                score += 1000000   # Penalty for weekdays
-                    
-                    # Roles Priority Score (mirroring scheduler.ts)
-                    score += get_req_priority(req['role']) * 20000000
-
-                    if is_saturday:
-                        if worked_yesterday:
-                            score -= 10000000 
-                        else:
-                            score += 10000000 
-                    
-                    if not worked_yesterday:
-                        if days_since < 3: score += 1000000
-                        if days_since == 2: score += 50000000 # STRONG GAP PENALTY (Avoid 1-0-1)
-                        if days_since < 2: score += 1000000
-                    
-                    # Streak Bonus: Encourage 2-3 day blocks
-                    if not is_weekend and streak > 0 and streak < 3:
-                        score -= 25000000
-                    
-                    # 4. Post-ALAT Rotation Penalty
-                    # Ensure everyone goes home at least once in the week following ALAT.
-                    # We penalize picking someone who hasn't had a day off yet in this week.
-                    if is_post_alat_week:
-                        # Count days off since alat_end_date
-                        days_since_alat = (day - alat_end_date).days # 1 to 7
-                        # Check how many shifts in this period 
-                        period_shifts = [s for s in shifts if s.person_id == person.id and alat_end_date < datetime.strptime(s.date, "%Y-%m-%d") < day]
-                        if len(period_shifts) == days_since_alat - 1 and days_since_alat > 1:
-                            # They have worked every day so far! Give penalty.
-                            # Increasing penalty as we get closer to day 7.
-                            score += days_since_alat * 3000000
-                    
-                    p_role_count = role_counts[person.id].get(req['role'], 0)
+
+                    score = base + role_priority_score
+
+                    p_role_count = person_role_counts.get(role, 0)
                     score += p_role_count * 100
-                    
-                    is_specialist = req['role'].lower() in ['medic', 'driver']
-                    is_staff_unit = (person.unit or '').lower() == 'staff'
-                    
-                    if not is_specialist and not is_staff_unit and person.unit and person.unit in assigned_units_today:
+
+                    if not is_specialist and unit_clash:
                         score -= 500000
-                    
-                    if best_choice is None or score < best_choice['score']:
+
+                    if score < best_score:
+                        best_score = score
                         best_choice = {
                             'person': person,
-                            'role': req['role'],
-                            'score': score,
+                            'role': role,
                             'req_obj': req
                         }
             
@@ -539,7 +725,12 @@ def attempt_generate(
                 person_id=p.id
             )
             shifts.append(s)
-            
+            shifts_by_date.setdefault(day_str, []).append(s)
+            key = (day_str, r_name)
+            day_role_filled[key] = day_role_filled.get(key, 0) + 1
+            if alat_end_date and day > alat_end_date:
+                post_alat_shifts[p.id] += 1
+
             shift_counts[p.id] += 1
             last_shift_date[p.id] = day
             assigned_today.add(p.id)
@@ -554,25 +745,22 @@ def attempt_generate(
             req_obj['remaining'] -= 1
             total_needed -= 1
             
-    dates_in_period = [d.strftime("%Y-%m-%d") for d in days]
-    last_two_days = [d.strftime("%Y-%m-%d") for d in days[-2:]]
-    
-    for d_str in dates_in_period:
+    last_two_days = date_strs[-2:]
+
+    for d_str, d_obj in zip(date_strs, days):
         if d_str in last_two_days:
             continue
-            
-        d_obj = datetime.strptime(d_str, "%Y-%m-%d")
+
         if alat_end_date and d_obj <= alat_end_date:
             continue
             
 
-        day_shifts = [s for s in shifts if s.date == d_str]
         for req in requirements:
             target_count = req.count
             if req.role == 'total_soldiers' and boost > 0 and d_str in boost_dates:
                 target_count += boost
-                
-            count = len([s for s in day_shifts if s.role == req.role])
+
+            count = day_role_filled.get((d_str, req.role), 0)
             if count < target_count:
                 if debug:
                     print(f"  [Fail] {d_str}: {req.role} {count}/{target_count}")
@@ -594,13 +782,22 @@ def fill_extra_shifts(
 
     print(f"\n--- Post-Processing: Filling Extra Shifts (Max Boost: {max_boost_param}) ---")
     
-    # helper
-    def get_assignment_map(current_shifts):
-        m = {d.strftime("%Y-%m-%d"): set() for d in days_list}
+    # Day strings formatted once; everything below works with day indexes
+    dates_str = [d.strftime("%Y-%m-%d") for d in days_list]
+    last_two = dates_str[-2:]
+
+    date_to_idx = {d_str: i for i, d_str in enumerate(dates_str)}
+    n_days = len(dates_str)
+
+    # Per-person occupancy as an int bitmask over day indexes: bit i set
+    # means the person already works on day i
+    def get_busy_masks(current_shifts):
+        masks = {p.id: 0 for p in people}
         for s in current_shifts:
-            if s.date in m:
-                m[s.date].add(s.person_id)
-        return m
+            i = date_to_idx.get(s.date)
+            if i is not None and s.person_id in masks:
+                masks[s.person_id] |= 1 << i
+        return masks
 
     # Calculate current vacation days
     total_days = len(days_list)
@@ -620,79 +817,70 @@ def fill_extra_shifts(
     print(f"Found {len(slack_people)} soldiers with > {target_min_vacation} vacation days to utilize.")
     
     current_shifts = list(initial_shifts)
-    assignment_map = get_assignment_map(current_shifts)
-    
-    # Last shift date cache for validity checks
-    last_shift_date = {p.id: None for p in people}
-    # Pre-populate last dates from initial schedule (must scan chronologically)
-    sorted_shifts = sorted(initial_shifts, key=lambda s: s.date)
-    for s in sorted_shifts:
-        d = datetime.strptime(s.date, "%Y-%m-%d")
-        # simplistic: just overwrite, we only need to know "most recent" relative to where we insert
-        # Actually, for insertion logic we need to be careful. 
-        # Let's just do checks dynamically per day.
-        pass
-
-    # Better approach: Iterate days, try to fit slack people
-    dates_str = [d.strftime("%Y-%m-%d") for d in days_list]
-    last_two = dates_str[-2:]
-    
-    boosted_days = {}
+    busy_masks = get_busy_masks(current_shifts)
+
+    # Same bitmask encoding for unavailability, and a precomputed
+    # yesterday/today/tomorrow window per day index
+    unavail_masks = {
+        p.id: sum(1 << i for i, d_str in enumerate(dates_str) if d_str in p.unavailable_dates)
+        for p in people
+    }
+    window_masks = [
+        (1 << i) | (1 << (i - 1) if i > 0 else 0) | (1 << (i + 1) if i + 1 < n_days else 0)
+        for i in range(n_days)
+    ]
 
-    # Better approach: Iterate days, try to fit slack people
-    dates_str = [d.strftime("%Y-%m-%d") for d in days_list]
-    last_two = dates_str[-2:]
-    
     boosted_days = {}
 
     # NEW LOGIC: Any 2 days per week, target +4
-    
-    # helper to check ability to add
-    def can_add(p, d_str, d_obj, current_map):
-        if d_str in p.unavailable_dates: return False
-        if d_str in current_map and p.id in current_map[d_str]: return False
-        
-        yesterday_str = (d_obj - timedelta(days=1)).strftime("%Y-%m-%d")
-        tomorrow_str = (d_obj + timedelta(days=1)).strftime("%Y-%m-%d")
-        if yesterday_str in current_map and p.id in current_map[yesterday_str]: return False
-        if tomorrow_str in current_map and p.id in current_map[tomorrow_str]: return False
-        return True
+
+    # helper to check ability to add; three dict/set probes collapse into
+    # two mask tests
+    def can_add(p, d_idx, busy):
+        if (unavail_masks[p.id] >> d_idx) & 1: return False
+        return not (busy[p.id] & window_masks[d_idx])
 
     # Group days by week (Sunday to Saturday)
     weeks = {}
-    for d_obj in days_list:
-        d_str = d_obj.strftime("%Y-%m-%d")
+    for d_idx, d_obj in enumerate(days_list):
         if alat_end_date and d_obj <= alat_end_date: continue
-        if d_str in last_two: continue
-        
+        if dates_str[d_idx] in last_two: continue
+
         # ISO week starts Monday, let's use standard ISO week number
         wk = d_obj.isocalendar()[1]
         if wk not in weeks: weeks[wk] = []
-        weeks[wk].append(d_obj)
-        
+        weeks[wk].append(d_idx)
+
+    full_mask = (1 << n_days) - 1
+
     # Process each week
     for wk, week_days in weeks.items():
+        # One free-day mask per eligible slack person, rebuilt from the
+        # current occupancy: blocked = busy | busy<<1 | busy>>1 | unavail,
+        # so a day's potential is a single bit probe per person instead of
+        # a can_add call
+        free_masks = []
+        for p in slack_people:
+            if people_vacation[p.id] <= target_min_vacation: continue
+            busy = busy_masks[p.id]
+            blocked = busy | (busy << 1) | (busy >> 1) | unavail_masks[p.id]
+            free_masks.append(~blocked & full_mask)
+
         # Find best 2 days in this week to boost
-        day_potentials = []
-        
-        for d_obj in week_days:
-            d_str = d_obj.strftime("%Y-%m-%d")
-            potential = 0
-            for p in slack_people:
-                if people_vacation[p.id] <= target_min_vacation: continue
-                if can_add(p, d_str, d_obj, assignment_map):
-                    potential += 1
-            day_potentials.append({'date': d_obj, 'potential': potential})
-            
+        day_potentials = [
+            {'day_idx': d_idx, 'potential': sum((m >> d_idx) & 1 for m in free_masks)}
+            for d_idx in week_days
+        ]
+
         # Sort by potential descending
         day_potentials.sort(key=lambda x: x['potential'], reverse=True)
-        
+
         # Pick top 2
-        target_days = [x['date'] for x in day_potentials[:2]]
-        
+        target_days = [x['day_idx'] for x in day_potentials[:2]]
+
         # Apply Boost to target days
-        for d_obj in target_days:
-            d_str = d_obj.strftime("%Y-%m-%d")
+        for d_idx in target_days:
+            d_str = dates_str[d_idx]
             added_count = 0
             # Target slightly less than max in burst to allow topping up? 
             # Or target max directly. Let's target max directly.
@@ -704,8 +892,8 @@ def fill_extra_shifts(
             for p in slack_people:
                 if added_count >= target_boost: break
                 if people_vacation[p.id] <= target_min_vacation: continue
-                
-                if can_add(p, d_str, d_obj, assignment_map):
+
+                if can_add(p, d_idx, busy_masks):
                     # Assign
                     new_shift = Shift(
                         id=f"{d_str}-soldier_extra_fill_burst-{p.id}",
@@ -721,14 +909,14 @@ def fill_extra_shifts(
             if added_count >= 3:
                  current_shifts.extend(potential_shifts)
                  for p in potential_people:
-                     assignment_map[d_str].add(p.id)
+                     busy_masks[p.id] |= 1 << d_idx
                      people_vacation[p.id] -= 1
                  boosted_days[d_str] = added_count
 
     # 2. General Pass (Remaining Slack)
-    for d_obj in days_list:
-        d_str = d_obj.strftime("%Y-%m-%d")
-        
+    for d_idx, d_obj in enumerate(days_list):
+        d_str = dates_str[d_idx]
+
         # Skip ALAT & Last 2
         if alat_end_date and d_obj <= alat_end_date: continue
         if d_str in last_two: continue
@@ -746,8 +934,8 @@ def fill_extra_shifts(
         for p in slack_people:
             if added_count >= (max_boost - current_added): break
             if people_vacation[p.id] <= target_min_vacation: continue
-            
-            if can_add(p, d_str, d_obj, assignment_map):
+
+            if can_add(p, d_idx, busy_masks):
                 new_shift = Shift(
                     id=f"{d_str}-soldier_extra_fill-{p.id}",
                     date=d_str,
@@ -766,7 +954,7 @@ def fill_extra_shifts(
         if total_boost >= 3 and added_count > 0:
              current_shifts.extend(potential_shifts)
              for i, p in enumerate(potential_people):
-                 assignment_map[d_str].add(p.id)
+                 busy_masks[p.id] |= 1 << d_idx
                  people_vacation[p.id] -= 1
              boosted_days[d_str] = total_boost
             
@@ -797,6 +985,12 @@ def main():
     
     campaign_summaries = []
 
+    # One worker pool shared by all campaigns; spawning a fresh pool per
+    # campaign would pay process startup N times
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 4, 16)
+    )
+
     for campaign in campaigns:
         print(f"\n==========================================")
         print(f"Running Campaign: {campaign.name}")
@@ -812,9 +1006,9 @@ def main():
             curr += timedelta(days=1)
 
         # Filter out external roles (filled by external personnel)
-        internal_requirements = [req for req in campaign.requirements if not req.role.startswith('external_')]
+        internal_requirements = campaign.internal_requirements
 
-        schedule = generate_schedule(people, internal_requirements, campaign.start_date, campaign.end_date, campaign.alat_end_date, campaign.boost, campaign.boost_dates, campaign.retries)
+        schedule = generate_schedule(people, internal_requirements, campaign.start_date, campaign.end_date, campaign.alat_end_date, campaign.boost, campaign.boost_dates, campaign.retries, executor=executor)
         
         if not schedule:
             print(f"!!! Failed to generate schedule for {campaign.name} !!!")
@@ -836,9 +1030,16 @@ def main():
         soldier_data = [] # List of (name, vac_days)
         commander_data = []
 
+        # Group the schedule once; the stats here and the CSV export below
+        # both read these instead of re-scanning the flat shift list
+        shifts_per_person: Counter = Counter()
+        workers_by_date: Dict[str, Set[str]] = {}
+        for s in schedule:
+            shifts_per_person[s.person_id] += 1
+            workers_by_date.setdefault(s.date, set()).add(s.person_id)
+
         for p in people:
-            shifts_worked = len([s for s in schedule if s.person_id == p.id])
-            vacation_days = total_campaign_days - shifts_worked
+            vacation_days = total_campaign_days - shifts_per_person.get(p.id, 0)
             
             if p.unit in ['1', '2', '3']:
                 role = p.roles[0].lower() if p.roles else ''
@@ -853,10 +1054,13 @@ def main():
 
         def get_min_max_people(data):
             if not data: return 0, 0, [], []
-            min_v = min(d[1] for d in data)
-            max_v = max(d[1] for d in data)
-            least_v_people = [d[0] for d in data if d[1] == min_v]
-            most_v_people = [d[0] for d in data if d[1] == max_v]
+            # Single pass for both extremes instead of separate min()/max()
+            min_v = max_v = data[0][1]
+            for _, v in data:
+                if v < min_v: min_v = v
+                elif v > max_v: max_v = v
+            least_v_people = [n for n, v in data if v == min_v]
+            most_v_people = [n for n, v in data if v == max_v]
             return min_v, max_v, least_v_people, most_v_people
 
         s_min, s_max, s_least_names, s_most_names = get_min_max_people(soldier_data)
@@ -893,21 +1097,33 @@ def main():
             dates_full.append(c.strftime("%Y-%m-%d"))
             c += timedelta(days=1)
 
-        csv_lines = ['person_id,date,description']
-        for d_str in dates_full:
-            workers_today = {s.person_id for s in schedule if s.date == d_str}
-            for p in people:
-                if p.id not in workers_today:
-                    desc = 'vacation'
-                    if p.unit:
-                        desc = f"unit_{p.unit}_rotation"
-                    csv_lines.append(f"{p.id},{d_str},{desc}")
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            f.write('\n'.join(csv_lines))
+        desc_for_person = {
+            p.id: (f"unit_{p.unit}_rotation" if p.unit else 'vacation')
+            for p in people
+        }
+
+        # The table is mostly absences; stream (person_id, date, description)
+        # rows through the C-level csv writer with a large buffer instead of
+        # formatting every line in Python and joining one giant string
+        person_rows = [(p.id, desc_for_person[p.id]) for p in people]
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(['person_id', 'date', 'description'])
+            for d_str in dates_full:
+                workers_today = workers_by_date.get(d_str)
+                if workers_today:
+                    writer.writerows(
+                        (pid, d_str, desc)
+                        for pid, desc in person_rows
+                        if pid not in workers_today
+                    )
+                else:
+                    # Nobody scheduled: the whole roster is absent
+                    writer.writerows((pid, d_str, desc) for pid, desc in person_rows)
         
         print(f"Created {output_filename}")
 
+    executor.shutdown()
 
     # --- Final Summary Report ---
     print("\n\n######################################################")
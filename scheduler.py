@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import bisect
 import datetime as dt
+import heapq
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence, Set, Tuple
@@ -11,16 +13,65 @@ from .data_models import Campaign, Mission, Person, Preference, Vacation
 # Very high penalty for assigning someone on scheduled vacation
 VACATION_PENALTY = 10000.0
 
+# Largest possible bonus (score reduction) per preference type; used to bound
+# how far below zero a person's preference score can go
+_PREF_BONUS_WEIGHTS = {
+    "pair_with": 20.0,
+    "prefer_mission": 15.0,
+    "prefer_weekend": 10.0,
+    "prefer_weekday": 10.0,
+}
+
 
 @dataclass
 class PersonState:
     """Tracks a person's state during scheduling."""
     person: Person
     missions_assigned: List[Mission] = field(default_factory=list)
-    
+    # Running hours sum maintained by add_mission so total_hours is O(1);
+    # assignments should go through add_mission, not missions_assigned.append
+    _hours: float = field(default=0.0, repr=False)
+    # (start, end) tuples kept sorted by start, with parallel start and
+    # prefix-max-end lists for bisection: the overlap filter probes two
+    # positions instead of scanning every assigned mission, and stays sound
+    # even if loaded assignments already overlap each other
+    _intervals: List[Tuple[dt.datetime, dt.datetime]] = field(default_factory=list, repr=False)
+    _interval_starts: List[dt.datetime] = field(default_factory=list, repr=False)
+    _interval_max_ends: List[dt.datetime] = field(default_factory=list, repr=False)
+    # Mission ids mirroring missions_assigned so is_assigned_to is a hash probe
+    _mission_ids: Set[str] = field(default_factory=set, repr=False)
+    # Latest-ending mission and its end time, maintained by add_mission so the
+    # rest check needs neither a max() pass nor a second scan
+    _last_mission: Optional[Mission] = field(default=None, repr=False)
+    _last_end: Optional[dt.datetime] = field(default=None, repr=False)
+    # Fairness denominator (vacation count + 1), set once by the scheduler so
+    # ratio math reads a field instead of hashing the person id per candidate
+    _vac_denom: int = field(default=1, repr=False)
+
+    def add_mission(self, mission: Mission) -> None:
+        """Record an assignment and keep the running hours total current."""
+        self.missions_assigned.append(mission)
+        self._hours += mission.duration_hours()
+        i = bisect.bisect_right(self._interval_starts, mission.start)
+        self._interval_starts.insert(i, mission.start)
+        self._intervals.insert(i, (mission.start, mission.end))
+        maxes = self._interval_max_ends
+        end = mission.end
+        maxes.insert(i, end if i == 0 else max(maxes[i - 1], end))
+        # Fold the new end into the running maxima to its right; stop at the
+        # first entry it no longer raises
+        for k in range(i + 1, len(maxes)):
+            if maxes[k] >= end:
+                break
+            maxes[k] = end
+        self._mission_ids.add(mission.mission_id)
+        if self._last_end is None or mission.end > self._last_end:
+            self._last_mission = mission
+            self._last_end = mission.end
+
     def total_hours(self) -> float:
         """Total hours assigned to missions."""
-        return sum(m.duration_hours() for m in self.missions_assigned)
+        return self._hours
     
     def mission_count(self) -> int:
         """Number of missions assigned."""
@@ -28,13 +79,11 @@ class PersonState:
     
     def last_mission_end(self) -> Optional[dt.datetime]:
         """End time of most recent mission."""
-        if not self.missions_assigned:
-            return None
-        return max(m.end for m in self.missions_assigned)
+        return self._last_end
     
     def is_assigned_to(self, mission: Mission) -> bool:
         """Check if person is assigned to a specific mission."""
-        return any(m.mission_id == mission.mission_id for m in self.missions_assigned)
+        return mission.mission_id in self._mission_ids
 
 
 @dataclass
@@ -85,56 +134,143 @@ class Scheduler:
         self.campaign = campaign
         self.rest_cap_hours = campaign.rest_cap_hours
         
-        # Index vacations by (person_id, date)
+        # Index vacations by (person_id, date), plus a per-person bitmask over
+        # day offsets from the campaign start so is_on_vacation is a shift+AND
         self.vacations: Dict[Tuple[str, dt.date], Vacation] = {}
+        self._vacation_epoch = campaign.start_date
+        self._vacation_masks: Dict[str, int] = defaultdict(int)
         for v in vacations:
             self.vacations[(v.person_id, v.date)] = v
+            offset = (v.date - self._vacation_epoch).days
+            if offset >= 0:
+                self._vacation_masks[v.person_id] |= 1 << offset
         
         # Index preferences by person_id
         self.preferences: Dict[str, List[Preference]] = defaultdict(list)
         for p in preferences:
             self.preferences[p.person_id].append(p)
-        
+
+        # Pre-packed (type, target, weight, expires) rows per person: the
+        # scoring loop then reads plain tuple slots instead of dataclass
+        # attributes plus a priority_weight() call per preference. Mission-name
+        # targets are lowered here once instead of per candidate. Reuse the
+        # store's cached packing when one was passed in.
+        packed = getattr(preferences, "packed_by_person", None)
+        self._packed_prefs: Dict[str, List[Tuple[str, str, float, Optional[dt.date]]]]
+        if packed is not None:
+            self._packed_prefs = packed()
+        else:
+            self._packed_prefs = {
+                pid: [
+                    (
+                        p.type,
+                        p.target.lower() if p.type in ("prefer_mission", "avoid_mission") else p.target,
+                        p.priority_weight(),
+                        p.expires,
+                    )
+                    for p in prefs
+                ]
+                for pid, prefs in self.preferences.items()
+            }
+        
+        # Most negative preference score each person could possibly earn
+        # (expiry ignored, so it stays a valid lower bound); lets the top-k
+        # path in get_candidates rule candidates out without full scoring
+        self._pref_floor: Dict[str, float] = {}
+        for pid, packed_rows in self._packed_prefs.items():
+            floor = 0.0
+            for ptype, _target, weight, _expires in packed_rows:
+                bonus = _PREF_BONUS_WEIGHTS.get(ptype)
+                if bonus is not None:
+                    floor -= bonus * weight
+            if floor:
+                self._pref_floor[pid] = floor
+
+        # Rest-multiplier and must-vacation preferences resolved up front
+        # (targets parsed once); the hot-path helpers below then walk a
+        # per-person list that is usually empty instead of scanning every
+        # preference type per call
+        self._rest_prefs: Dict[str, List[Tuple[float, Optional[dt.date]]]] = defaultdict(list)
+        self._must_vacation: Dict[str, List[Tuple[dt.date, Optional[dt.date]]]] = defaultdict(list)
+        for pid, prefs in self.preferences.items():
+            for pref in prefs:
+                if pref.type == "rest_multiplier":
+                    try:
+                        self._rest_prefs[pid].append((float(pref.target), pref.expires))
+                    except ValueError:
+                        pass
+                elif pref.type == "must_vacation_date":
+                    try:
+                        self._must_vacation[pid].append(
+                            (dt.date.fromisoformat(pref.target), pref.expires)
+                        )
+                    except ValueError:
+                        pass
+
         # Build person state from existing assignments
         self.states: Dict[str, PersonState] = {}
         for person in people:
             self.states[person.person_id] = PersonState(person=person)
+
+        # Inverted role index: candidate scans walk only the states that can
+        # actually fill the requested role
+        self._by_role: Dict[str, List[PersonState]] = defaultdict(list)
+        for state in self.states.values():
+            for r in {state.person.role, *state.person.secondary_roles}:
+                self._by_role[r].append(state)
+
+        # Primary-role groups for fairness: Person.role never changes, so the
+        # cache-miss path in _calculate_fairness reads this instead of
+        # filtering every state
+        self._states_by_primary_role: Dict[str, List[PersonState]] = defaultdict(list)
+        for state in self.states.values():
+            self._states_by_primary_role[state.person.role].append(state)
         
         # Load existing assignments from missions
         for mission in missions:
             for person_id in mission.all_assigned_people():
                 if person_id in self.states:
-                    self.states[person_id].missions_assigned.append(mission)
+                    self.states[person_id].add_mission(mission)
+
+        # Per-role (avg_ratio, group_size) memo for fairness scoring;
+        # assign_to_mission drops the affected role's entry
+        self._role_ratio_cache: Dict[str, Tuple[float, int]] = {}
+
+        # Single-entry memo of mission-static preference contributions
+        # (see _static_pref_scores); candidates for one mission share it
+        self._mission_pref_cache: Tuple[Optional[tuple], Dict[str, float]] = (None, {})
         
         # Count vacations per person (for fairness calculation)
         self.vacation_counts: Dict[str, int] = defaultdict(int)
         for v in vacations:
             self.vacation_counts[v.person_id] += 1
+
+        # Vacations are fixed for the scheduler's lifetime, so each state
+        # carries its fairness denominator instead of the scoring loop
+        # probing vacation_counts per candidate
+        for state in self.states.values():
+            state._vac_denom = self.vacation_counts.get(state.person.person_id, 0) + 1
     
     def is_on_vacation(self, person_id: str, date: dt.date) -> bool:
         """Check if person has scheduled vacation on date."""
+        offset = (date - self._vacation_epoch).days
+        if offset >= 0:
+            return (self._vacation_masks.get(person_id, 0) >> offset) & 1 == 1
+        # Dates before the campaign start fall back to the exact index
         return (person_id, date) in self.vacations
     
     def get_rest_multiplier(self, person_id: str, date: dt.date) -> float:
         """Get rest multiplier from preferences."""
-        for pref in self.preferences.get(person_id, []):
-            if pref.type == "rest_multiplier" and pref.is_active(date):
-                try:
-                    return float(pref.target)
-                except ValueError:
-                    pass
+        for value, expires in self._rest_prefs.get(person_id, ()):
+            if expires is None or date <= expires:
+                return value
         return 1.0
-    
+
     def has_must_vacation(self, person_id: str, date: dt.date) -> bool:
         """Check if person has must_vacation_date preference for date."""
-        for pref in self.preferences.get(person_id, []):
-            if pref.type == "must_vacation_date" and pref.is_active(date):
-                try:
-                    pref_date = dt.date.fromisoformat(pref.target)
-                    if pref_date == date:
-                        return True
-                except ValueError:
-                    pass
+        for pref_date, expires in self._must_vacation.get(person_id, ()):
+            if pref_date == date and (expires is None or date <= expires):
+                return True
         return False
     
     def get_candidates(
@@ -142,30 +278,36 @@ class Scheduler:
         mission: Mission,
         role: str,
         already_assigned: Set[str],
+        top_k: Optional[int] = None,
     ) -> List[CandidateScore]:
         """
         Get ranked candidates for a role in a mission.
-        
+
         Args:
             mission: The mission to assign
             role: The role to fill
             already_assigned: Person IDs already assigned to this mission
-        
+            top_k: If given, return only the best top_k candidates; lets the
+                scoring loop skip candidates that provably cannot place
+
         Returns:
             List of CandidateScore, sorted by total_score (lower is better)
         """
-        candidates: List[CandidateScore] = []
+        # Sortable (total_score, person_id, score) rows: tuples compare natively,
+        # so the sort below needs no per-comparison key callback.
+        rows: List[Tuple[float, str, CandidateScore]] = []
         mission_date = mission.start.date()
-        
-        for person_id, state in self.states.items():
+        # Max-heap (negated totals) of the top_k best scores seen so far,
+        # giving the cutoff the lower-bound check prunes against
+        heap: List[float] = []
+
+        for state in self._by_role.get(role, ()):
             person = state.person
-            
+            person_id = person.person_id
+
             # === HARD CONSTRAINTS (filter out) ===
-            
-            # Must be able to fill the role
-            if not person.can_fill_role(role):
-                continue
-            
+            # (role eligibility is implied by the _by_role index)
+
             # Cannot be already assigned to this mission
             if person_id in already_assigned:
                 continue
@@ -183,37 +325,58 @@ class Scheduler:
                 continue
             
             # === SOFT CONSTRAINTS (scoring) ===
+            if top_k is not None and len(heap) == top_k:
+                # Cheap lower bound on the full score: vacation penalty and
+                # role match cost a dict probe each, and fairness/unit
+                # cohesion are never negative, so only the preference floor
+                # can pull the total below this
+                lower_bound = self._pref_floor.get(person_id, 0.0)
+                if person.role != role:
+                    lower_bound += 10.0
+                if self.is_on_vacation(person_id, mission_date):
+                    lower_bound += VACATION_PENALTY
+                if lower_bound > -heap[0]:
+                    continue
+
             score = self._calculate_score(state, mission, role, already_assigned)
-            candidates.append(score)
-        
-        # Sort by total score (lower is better)
-        candidates.sort(key=lambda c: (c.total_score, c.person.person_id))
-        return candidates
+            rows.append((score.total_score, person_id, score))
+            if top_k is not None:
+                heapq.heappush(heap, -score.total_score)
+                if len(heap) > top_k:
+                    heapq.heappop(heap)
+
+        # Sort by total score (lower is better), person_id as tiebreak
+        rows.sort()
+        if top_k is not None:
+            del rows[top_k:]
+        return [score for _, _, score in rows]
     
     def _has_overlap(self, state: PersonState, mission: Mission) -> bool:
         """Check if person has an overlapping mission."""
-        for assigned in state.missions_assigned:
-            # Overlap if not (one ends before other starts)
-            if not (mission.end <= assigned.start or mission.start >= assigned.end):
-                return True
-        return False
+        starts = state._interval_starts
+        if not starts:
+            return False
+        m_start = mission.start
+        m_end = mission.end
+        # Intervals left of the insertion point all start at or before
+        # m_start, so any of them overlaps iff the largest end among them
+        # passes m_start — that is the prefix max. Intervals at or right of
+        # it start after m_start, so the first one overlaps iff it starts
+        # before m_end. No non-overlap invariant on the stored intervals is
+        # needed (loaded assignment data may violate it).
+        i = bisect.bisect_right(starts, m_start)
+        if i and state._interval_max_ends[i - 1] > m_start:
+            return True
+        return i < len(starts) and starts[i] < m_end
     
     def _has_enough_rest(self, state: PersonState, mission: Mission) -> bool:
         """Check if person has enough rest since last mission."""
-        last_end = state.last_mission_end()
-        if last_end is None:
-            return True
-        
-        # Find the mission that just ended
-        last_mission = None
-        for m in state.missions_assigned:
-            if m.end == last_end:
-                last_mission = m
-                break
-        
+        # Latest-ending mission is maintained incrementally by add_mission
+        last_mission = state._last_mission
         if last_mission is None:
             return True
-        
+        last_end = state._last_end
+
         # Calculate required rest
         rest_multiplier = self.get_rest_multiplier(state.person.person_id, mission.start.date())
         mission_duration = last_mission.duration_hours()
@@ -281,27 +444,78 @@ class Scheduler:
         Goal: Everyone in same role should have similar (hours worked / vacation days) ratio.
         Penalty if this person is below average (they can work more).
         """
-        # Get all people with same primary role
-        role_states = [s for s in self.states.values() if s.person.role == role]
-        
-        if len(role_states) <= 1:
+        cached = self._role_ratio_cache.get(role)
+        if cached is None:
+            # All people with same primary role, from the prebuilt index
+            role_states = self._states_by_primary_role.get(role, ())
+            if len(role_states) <= 1:
+                cached = (0.0, len(role_states))
+            else:
+                # Denominator is vacation count + 1: avoids division by zero,
+                # and makes the ratio meaningful
+                ratios = [s.total_hours() / s._vac_denom for s in role_states]
+                cached = (sum(ratios) / len(ratios), len(role_states))
+            self._role_ratio_cache[role] = cached
+
+        avg_ratio, group_size = cached
+        if group_size <= 1:
             return 0.0
-        
-        # Calculate ratio for each person
-        def get_ratio(s: PersonState) -> float:
-            hours = s.total_hours()
-            vacations = self.vacation_counts.get(s.person.person_id, 0)
-            # Add 1 to avoid division by zero, and to make ratio meaningful
-            return hours / (vacations + 1)
-        
-        ratios = [get_ratio(s) for s in role_states]
-        avg_ratio = sum(ratios) / len(ratios)
-        person_ratio = get_ratio(state)
-        
+
+        person_ratio = state.total_hours() / state._vac_denom
+
         # Penalty if below average (they've had more rest, can work more)
         # Score is how far below average they are (negative = below average)
         return max(0, avg_ratio - person_ratio) * 10
     
+    def _static_pref_scores(self, mission: Mission) -> Dict[str, float]:
+        """
+        Per-person preference contributions that depend only on the mission.
+
+        Mission-name and weekend/weekday preferences are identical for every
+        candidate of a mission, so they are totalled in one pass over the
+        actual preferences and memoized until a different mission is scored.
+        Only the pair_with/avoid_person terms remain per-candidate work.
+        """
+        key = (mission.mission_id, mission.start, mission.name)
+        cached_key, table = self._mission_pref_cache
+        if cached_key == key:
+            return table
+
+        mission_date = mission.start.date()
+        mission_name = mission.name_lower()
+        is_weekend = mission_date.weekday() >= 5  # Saturday = 5, Sunday = 6
+
+        table = {}
+        for person_id, rows in self._packed_prefs.items():
+            score = 0.0
+            for ptype, target, weight, expires in rows:
+                if expires is not None and mission_date > expires:
+                    continue
+
+                if ptype == "prefer_mission":
+                    # Bonus if mission name matches (targets pre-lowered)
+                    if target in mission_name:
+                        score -= 15 * weight  # Negative = bonus
+
+                elif ptype == "avoid_mission":
+                    # Penalty if mission name matches
+                    if target in mission_name:
+                        score += 30 * weight
+
+                elif ptype == "prefer_weekend":
+                    if is_weekend:
+                        score -= 10 * weight
+
+                elif ptype == "prefer_weekday":
+                    if not is_weekend:
+                        score -= 10 * weight
+
+            if score:
+                table[person_id] = score
+
+        self._mission_pref_cache = (key, table)
+        return table
+
     def _calculate_preference_score(
         self,
         state: PersonState,
@@ -309,46 +523,26 @@ class Scheduler:
         already_assigned: Set[str],
     ) -> float:
         """Calculate preference-based score adjustments."""
-        score = 0.0
         person_id = state.person.person_id
         mission_date = mission.start.date()
-        
-        for pref in self.preferences.get(person_id, []):
-            if not pref.is_active(mission_date):
+        # Mission-static terms come from the shared memo; only the
+        # partner-dependent ones are evaluated here
+        score = self._static_pref_scores(mission).get(person_id, 0.0)
+
+        for ptype, target, weight, expires in self._packed_prefs.get(person_id, ()):
+            if expires is not None and mission_date > expires:
                 continue
-            
-            weight = pref.priority_weight()
-            
-            if pref.type == "pair_with":
+
+            if ptype == "pair_with":
                 # Bonus if partner is already assigned to same mission
-                if pref.target in already_assigned:
+                if target in already_assigned:
                     score -= 20 * weight  # Negative = bonus
-            
-            elif pref.type == "avoid_person":
+
+            elif ptype == "avoid_person":
                 # Penalty if person to avoid is assigned
-                if pref.target in already_assigned:
+                if target in already_assigned:
                     score += 50 * weight
-            
-            elif pref.type == "prefer_mission":
-                # Bonus if mission name matches
-                if pref.target.lower() in mission.name.lower():
-                    score -= 15 * weight
-            
-            elif pref.type == "avoid_mission":
-                # Penalty if mission name matches
-                if pref.target.lower() in mission.name.lower():
-                    score += 30 * weight
-            
-            elif pref.type == "prefer_weekend":
-                # Bonus if mission is on weekend
-                if mission_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    score -= 10 * weight
-            
-            elif pref.type == "prefer_weekday":
-                # Bonus if mission is on weekday
-                if mission_date.weekday() < 5:
-                    score -= 10 * weight
-        
+
         return score
     
     def assign_to_mission(self, mission: Mission, role: str, person_id: str) -> None:
@@ -360,7 +554,9 @@ class Scheduler:
         if person_id in self.states:
             state = self.states[person_id]
             if not state.is_assigned_to(mission):
-                state.missions_assigned.append(mission)
+                state.add_mission(mission)
+                # Peer ratios in this person's role group just changed
+                self._role_ratio_cache.pop(state.person.role, None)
     
     def get_unfilled_slots(self, missions: Sequence[Mission]) -> List[Tuple[Mission, str, int]]:
         """
@@ -399,59 +595,69 @@ def suggest_vacations(
         List of (person, score, reason) tuples, sorted by score (lower = better candidate)
     """
     suggestions: List[Tuple[Person, float, str]] = []
-    
+
     # Count current on-site staff per role for the target dates
     vacation_dates = [target_date + dt.timedelta(days=i) for i in range(days)]
-    vacation_set = {(v.person_id, v.date) for v in vacations}
-    
-    # Get mission assignments for target dates
-    missions_in_range = [
-        m for m in missions
-        if any(m.start.date() == d for d in vacation_dates)
-    ]
-    
+    date_range = set(vacation_dates)
+
+    # One pass over vacations: who is away on any target date, plus
+    # per-person vacation totals for the fairness term
+    away_ids: Set[str] = set()
+    vacation_counts: Dict[str, int] = defaultdict(int)
+    for v in vacations:
+        vacation_counts[v.person_id] += 1
+        if v.date in date_range:
+            away_ids.add(v.person_id)
+
+    # Per-role membership and on-site headcounts, computed once instead of
+    # rescanning everyone for every person
+    role_ids: Dict[str, Set[str]] = defaultdict(set)
+    for p in people:
+        role_ids[p.role].add(p.person_id)
+    on_site_by_role = {
+        r: len(ids) - len(away_ids & ids) for r, ids in role_ids.items()
+    }
+
+    # Mission assignments for target dates, inverted to person -> mission
+    # names so the scoring loop below reads one dict entry instead of
+    # testing membership against every in-range mission per person
+    mission_names_by_person: Dict[str, List[str]] = defaultdict(list)
+    for m in missions:
+        if m.start.date() in date_range:
+            for pid in m.assigned_set():
+                mission_names_by_person[pid].append(m.name)
+
     for person in people:
         reasons = []
         score = 0.0
-        
+        person_id = person.person_id
+
         # Check capacity: would sending this person home violate on_duty_estimates?
         role = person.role
         min_required = campaign.on_duty_estimates.get(role, 0)
-        
-        # Count others with same role who are NOT on vacation for these dates
-        on_site_count = 0
-        for p in people:
-            if p.role == role and p.person_id != person.person_id:
-                on_vacation_any_day = any(
-                    (p.person_id, d) in vacation_set for d in vacation_dates
-                )
-                if not on_vacation_any_day:
-                    on_site_count += 1
-        
+
+        # Others with same role who are NOT on vacation for these dates
+        on_site_count = on_site_by_role[role]
+        if person_id not in away_ids:
+            on_site_count -= 1
+
         if on_site_count < min_required:
             score += 1000  # Cannot send home - would be understaffed
             reasons.append(f"would leave only {on_site_count}/{min_required} {role}s")
-        
+
         # Check if assigned to missions on these dates
-        for mission in missions_in_range:
-            if person.person_id in mission.all_assigned_people():
-                score += 500
-                reasons.append(f"assigned to {mission.name}")
-        
+        for mission_name in mission_names_by_person.get(person_id, ()):
+            score += 500
+            reasons.append(f"assigned to {mission_name}")
+
         # Check if already on vacation
-        already_on_vacation = any(
-            (person.person_id, d) in vacation_set for d in vacation_dates
-        )
-        if already_on_vacation:
+        if person_id in away_ids:
             score += 2000
             reasons.append("already on vacation")
-        
+
         # Fairness: prefer those who have worked more / had fewer vacations
-        person_vacation_count = sum(
-            1 for v in vacations if v.person_id == person.person_id
-        )
         # Lower vacation count = should go on vacation = lower score
-        score += person_vacation_count * 5
+        score += vacation_counts.get(person_id, 0) * 5
         
         # TODO: Add preference scoring for prefer_vacation_date, prefer_weekend, etc.
         
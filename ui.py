@@ -1,11 +1,17 @@
-import tkinter as tk
-from tkinter import ttk
-
-
 class SchedulerUI:
     """Placeholder UI not yet adapted to the new campaign/mission workflow."""
 
     def __init__(self, *_args, **_kwargs):
+        # Tk is imported lazily so CLI invocations that merely import this
+        # package do not pay the toolkit's startup cost (and headless
+        # installs without Tk get a clear error only if the UI is used)
+        try:
+            import tkinter as tk
+            from tkinter import ttk
+        except ImportError as exc:
+            raise RuntimeError(
+                "tkinter is not available; the UI requires a Tk installation"
+            ) from exc
         self.root = tk.Tk()
         self.root.title("Scheduler UI (placeholder)")
         label = ttk.Label(self.root, text="UI not implemented for the new model. Use CLI.")